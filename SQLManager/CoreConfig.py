@@ -6,37 +6,110 @@ sem modificar seus arquivos internos.
 
 Uso no projeto host:
     from SQLManager import CoreConfig
-    
+
     CoreConfig.configure(
         db_server='localhost',
         db_database='MyDB',
         db_user='admin',
         db_password='pass123'
     )
-    
+
     CoreConfig.register_regex('CustomEmail', r'^[\w\.-]+@mycompany\.com$')
 """
 
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import Optional, Dict, Any, Mapping
+from types import MappingProxyType
 import os
+import re
+import sys
+import threading
+
+# Snapshot do ambiente lido uma única vez no import: evita varrer o bloco
+# environ (e alocar strings novas) a cada reconfiguração
+_ENV_SNAPSHOT: Dict[str, str] = dict(os.environ)
+
+# Backend opcional google-re2: DFA de tempo linear, imune a backtracking
+# catastrófico em padrões registrados pelo projeto host (ReDoS)
+try:
+    import re2 as _re2  # type: ignore
+except ImportError:
+    _re2 = None
 
-class CoreConfig:
+def _compile_pattern(pattern: str) -> re.Pattern:
     """
-    Classe estática para configuração global do Core
+    Compila com re2 quando instalado; padrões fora do subconjunto suportado
+    (lookahead, backreference) e ambientes sem re2 caem no re nativo
     """
-    
-    _db_server: Optional[str] = None
-    _db_database: Optional[str] = None
-    _db_user: Optional[str] = None
-    _db_password: Optional[str] = None
-    _db_driver: str = "ODBC Driver 18 for SQL Server"
-    
-    _custom_regex: Dict[str, str] = {}
-    
-    _is_configured: bool = False
-    
-    @classmethod
-    def configure(cls, 
+    if _re2 is not None:
+        try:
+            return _re2.compile(pattern)
+        except Exception:
+            pass
+    return re.compile(pattern)
+
+class _CoreConfig:
+    """
+    Singleton de configuração global do Core
+
+    Instância única exposta como ``CoreConfig``; os slots substituem o
+    lookup de atributos de classe por offsets diretos nos hot paths.
+    """
+
+    __slots__ = (
+        '_db_server',
+        '_db_database',
+        '_db_user',
+        '_db_password',
+        '_db_driver',
+        '_custom_regex',
+        '_custom_regex_view',
+        '_pattern_intern',
+        '_hot_cache',
+        '_hot_cache_idx',
+        '_combined_matcher',
+        '_is_configured',
+        '_load_from_env',
+        '_db_config_cache',
+        '_write_lock',
+    )
+
+    # Cache quente (FIFO pequeno) na frente do dict completo: poucos IDs
+    # dominam o tráfego de validação, então a varredura curta resolve a maioria
+    # das consultas sem o probe no dict principal
+    _HOT_CACHE_SIZE: int = 32
+
+    _DEFAULT_DRIVER: str = "ODBC Driver 18 for SQL Server"
+
+    def __init__(self):
+        self._db_server: Optional[str] = None
+        self._db_database: Optional[str] = None
+        self._db_user: Optional[str] = None
+        self._db_password: Optional[str] = None
+        self._db_driver: str = self._DEFAULT_DRIVER
+
+        # Padrões já compilados na hora do registro (evita re.compile nos hot paths)
+        self._custom_regex: Dict[str, re.Pattern] = {}
+        self._custom_regex_view: Mapping[str, re.Pattern] = MappingProxyType(self._custom_regex)
+
+        # Interning de padrões: IDs-alias com o mesmo padrão compartilham um
+        # único re.Pattern (um compile por padrão distinto)
+        self._pattern_intern: Dict[str, re.Pattern] = {}
+
+        self._hot_cache: list = []
+        self._hot_cache_idx: int = 0
+        self._combined_matcher: Optional[re.Pattern] = None
+
+        self._is_configured: bool = False
+        self._load_from_env: bool = False
+        self._db_config_cache: Optional[Dict[str, Optional[str]]] = None
+
+        # Só escritores serializam; leitores acessam o snapshot publicado em
+        # _custom_regex sem lock (swap de referência é atômico no CPython)
+        self._write_lock = threading.Lock()
+
+    def configure(self,
                   db_server: Optional[str] = None,
                   db_database: Optional[str] = None,
                   db_user: Optional[str] = None,
@@ -45,7 +118,7 @@ class CoreConfig:
                   load_from_env: bool = True):
         """
         Configura o SQLManager com as credenciais do projeto host
-        
+
         Args:
             db_server: Servidor do banco de dados
             db_database: Nome do banco de dados
@@ -53,7 +126,7 @@ class CoreConfig:
             db_password: Senha do banco
             db_driver: Driver ODBC (opcional)
             load_from_env: Se True, tenta carregar do .env do projeto host primeiro
-        
+
         Exemplo:
             CoreConfig.configure(
                 db_server='localhost',
@@ -62,67 +135,94 @@ class CoreConfig:
                 db_password='pass123'
             )
         """
-        if load_from_env:
-            cls._db_server = db_server or os.getenv('DB_SERVER')
-            cls._db_database = db_database or os.getenv('DB_DATABASE')
-            cls._db_user = db_user or os.getenv('DB_USER')
-            cls._db_password = db_password or os.getenv('DB_PASSWORD')
-        else:
-            cls._db_server = db_server
-            cls._db_database = db_database
-            cls._db_user = db_user
-            cls._db_password = db_password
-        
+        # Guarda só os valores explícitos; o fallback para o .env é adiado
+        # até o primeiro get_db_config() (caminhos que usam apenas o registro
+        # de regex nunca pagam a leitura do ambiente)
+        self._db_server = db_server
+        self._db_database = db_database
+        self._db_user = db_user
+        self._db_password = db_password
+        self._load_from_env = load_from_env
+
         if db_driver:
-            cls._db_driver = db_driver
-        
-        cls._is_configured = True
-    
-    @classmethod
-    def is_configured(cls) -> bool:
+            self._db_driver = db_driver
+
+        self._db_config_cache = None
+        self._is_configured = True
+
+    def refresh_env(self):
+        """Reconstrói o snapshot do ambiente (caso raro de reload do .env)"""
+        global _ENV_SNAPSHOT
+        _ENV_SNAPSHOT = dict(os.environ)
+
+    def is_configured(self) -> bool:
         """Verifica se o Core foi configurado"""
-        return cls._is_configured
-    
-    @classmethod
-    def get_db_config(cls) -> Dict[str, Optional[str]]:
+        return self._is_configured
+
+    def get_db_config(self) -> Dict[str, Optional[str]]:
         """
         Retorna as configurações de banco de dados
-        
+
         Returns:
             Dict com server, database, user, password, driver
         """
-        return {
-            'server': cls._db_server,
-            'database': cls._db_database,
-            'user': cls._db_user,
-            'password': cls._db_password,
-            'driver': cls._db_driver
-        }
-    
-    @classmethod
-    def register_regex(cls, regex_id: str, pattern: str):
+        if self._db_config_cache is None:
+            if self._load_from_env:
+                # Resolve o fallback do .env uma única vez, na primeira leitura
+                self._db_server = self._db_server or _ENV_SNAPSHOT.get('DB_SERVER')
+                self._db_database = self._db_database or _ENV_SNAPSHOT.get('DB_DATABASE')
+                self._db_user = self._db_user or _ENV_SNAPSHOT.get('DB_USER')
+                self._db_password = self._db_password or _ENV_SNAPSHOT.get('DB_PASSWORD')
+                self._load_from_env = False
+            self._db_config_cache = {
+                'server': self._db_server,
+                'database': self._db_database,
+                'user': self._db_user,
+                'password': self._db_password,
+                'driver': self._db_driver
+            }
+        return self._db_config_cache
+
+    def register_regex(self, regex_id: str, pattern: str):
         r"""
         Registra um novo padrão regex customizado
-        
+
         Args:
             regex_id: Identificador único do regex
             pattern: Padrão regex (string)
-        
+
         Exemplo:
             CoreConfig.register_regex('CompanyEmail', r'^[\w\.-]+@mycompany\.com$')
-            
+
             my_edt = EDTController('CompanyEmail', DataType.String)
         """
-        cls._custom_regex[regex_id] = pattern
-    
-    @classmethod
-    def register_multiple_regex(cls, regex_dict: Dict[str, str]):
+        # Chaves internadas: lookups com literais curtos (auto-internados pelo
+        # compilador) viram comparação de ponteiro no dict
+        compiled = self._compile_interned(pattern)
+        with self._write_lock:
+            # Estilo RCU: monta snapshot novo e publica com uma atribuição
+            snapshot = dict(self._custom_regex)
+            snapshot[sys.intern(regex_id)] = compiled
+            self._publish_snapshot(snapshot)
+
+    def _compile_interned(self, pattern: str) -> re.Pattern:
+        """Compila um padrão reaproveitando o compilado de padrões idênticos"""
+        compiled = self._pattern_intern.get(pattern)
+        if compiled is None:
+            compiled = self._pattern_intern[pattern] = _compile_pattern(pattern)
+        return compiled
+
+    def register_multiple_regex(self, regex_dict: Dict[str, str], async_compile: bool = False):
         r"""
         Registra múltiplos padrões regex de uma vez
-        
+
         Args:
             regex_dict: Dicionário com {regex_id: pattern}
-        
+            async_compile: Se True, compila o lote numa thread de fundo e o
+                registro retorna imediatamente; os padrões ficam disponíveis
+                (num único update) quando a compilação terminar. O padrão
+                False preserva a semântica síncrona com fail-fast
+
         Exemplo:
             CoreConfig.register_multiple_regex({
                 'CompanyEmail': r'^[\w\.-]+@mycompany\.com$',
@@ -130,50 +230,140 @@ class CoreConfig:
                 'OrderNumber': r'^ORD-\d{8}$'
             })
         """
-        cls._custom_regex.update(regex_dict)
-    
-    @classmethod
-    def get_regex(cls, regex_id: str) -> Optional[str]:
+        if async_compile:
+            items = list(regex_dict.items())
+            thread = threading.Thread(target=self._compile_and_publish, args=(items,), daemon=True)
+            thread.start()
+            return
+
+        self._compile_and_publish(list(regex_dict.items()))
+
+    def _compile_and_publish(self, items: list):
+        """Compila um lote de padrões e publica tudo num único snapshot"""
+        # Compila em lote num dict local: uma só resolução do registro e
+        # menos rehashes para registros grandes
+        compiled = {sys.intern(regex_id): self._compile_interned(pattern) for regex_id, pattern in items}
+        with self._write_lock:
+            self._publish_snapshot({**self._custom_regex, **compiled})
+
+    def _publish_snapshot(self, snapshot: Dict[str, re.Pattern]):
+        """Publica um novo snapshot do registro (chamar com _write_lock preso)"""
+        self._custom_regex = snapshot
+        self._custom_regex_view = MappingProxyType(snapshot)
+        self._invalidate_hot_cache()
+
+    def get_regex(self, regex_id: str) -> Optional[str]:
         """
         Obtém um padrão regex customizado
-        
+
         Args:
             regex_id: Identificador do regex
-        
+
         Returns:
             String do padrão regex ou None se não existir
         """
-        return cls._custom_regex.get(regex_id)
-    
-    @classmethod
-    def has_regex(cls, regex_id: str) -> bool:
+        compiled = self._custom_regex.get(regex_id)
+        return compiled.pattern if compiled else None
+
+    def get_compiled_regex(self, regex_id: str) -> Optional[re.Pattern]:
+        """
+        Obtém o padrão regex customizado já compilado
+
+        Args:
+            regex_id: Identificador do regex
+
+        Returns:
+            re.Pattern compilado ou None se não existir
+        """
+        for cached_id, cached_pattern in self._hot_cache:
+            if cached_id == regex_id:
+                return cached_pattern
+
+        compiled = self._custom_regex.get(regex_id)
+        if compiled is not None:
+            self._promote_to_hot_cache(regex_id, compiled)
+        return compiled
+
+    def build_combined_matcher(self) -> Optional[re.Pattern]:
+        """
+        Retorna um regex único que OR-eia todos os padrões registrados
+
+        Cada padrão vira um grupo nomeado com o próprio regex_id (os IDs
+        precisam ser identificadores Python válidos); o ID casado sai em
+        ``match.lastgroup``. Validar N padrões vira uma única varredura da
+        entrada em vez de N tentativas sequenciais.
+
+        Returns:
+            re.Pattern combinado ou None se não houver regex registrado
+        """
+        if self._combined_matcher is None and self._custom_regex:
+            self._combined_matcher = re.compile('|'.join(
+                f'(?P<{regex_id}>{compiled.pattern})'
+                for regex_id, compiled in self._custom_regex.items()
+            ))
+        return self._combined_matcher
+
+    def _promote_to_hot_cache(self, regex_id: str, compiled: re.Pattern):
+        """Promove um regex ao cache quente (slot rotativo FIFO)"""
+        if len(self._hot_cache) < self._HOT_CACHE_SIZE:
+            self._hot_cache.append((regex_id, compiled))
+        else:
+            self._hot_cache[self._hot_cache_idx] = (regex_id, compiled)
+            self._hot_cache_idx = (self._hot_cache_idx + 1) % self._HOT_CACHE_SIZE
+
+    def _invalidate_hot_cache(self):
+        """Esvazia o cache quente (usado em registro/reset)"""
+        self._hot_cache.clear()
+        self._hot_cache_idx = 0
+        self._combined_matcher = None
+
+    def has_regex(self, regex_id: str) -> bool:
         """Verifica se um regex customizado existe"""
-        return regex_id in cls._custom_regex
-    
-    @classmethod
-    def get_all_custom_regex(cls) -> Dict[str, str]:
-        """Retorna todos os regex customizados registrados"""
-        return cls._custom_regex.copy()
-    
-    @classmethod
-    def reset(cls):
-        """Reseta todas as configurações (testes)"""
-        cls._db_server = None
-        cls._db_database = None
-        cls._db_user = None
-        cls._db_password = None
-        cls._db_driver = "ODBC Driver 18 for SQL Server"
-        cls._custom_regex = {}
-        cls._is_configured = False
-    
-    @classmethod
-    def configure_from_dict(cls, config: Dict[str, Any]):
+        return regex_id in self._custom_regex
+
+    def get_all_custom_regex(self) -> Mapping[str, re.Pattern]:
+        """
+        Retorna todos os regex customizados registrados
+
+        Returns:
+            View somente-leitura (zero cópia) sobre o snapshot atual do
+            registro; novos registros publicam um snapshot novo, então
+            reobtenha a view após registrar. Use snapshot_custom_regex()
+            se precisar de uma cópia isolada
+        """
+        return self._custom_regex_view
+
+    def snapshot_custom_regex(self) -> Dict[str, re.Pattern]:
+        """Retorna uma cópia isolada dos regex customizados registrados"""
+        return self._custom_regex.copy()
+
+    def reset(self):
+        """
+        Reseta todas as configurações (testes)
+
+        Os containers são esvaziados in-place: views obtidas via
+        get_all_custom_regex() continuam vivas (e vazias) após o reset
+        """
+        self._db_server = None
+        self._db_database = None
+        self._db_user = None
+        self._db_password = None
+        self._db_driver = self._DEFAULT_DRIVER
+        with self._write_lock:
+            self._custom_regex.clear()
+            self._pattern_intern.clear()
+            self._invalidate_hot_cache()
+        self._db_config_cache = None
+        self._load_from_env = False
+        self._is_configured = False
+
+    def configure_from_dict(self, config: Dict[str, Any]):
         r"""
         Configura a partir de um dicionário
-        
+
         Args:
             config: Dicionário com as configurações
-        
+
         Exemplo:
             config = {
                 'db_server': 'localhost',
@@ -186,7 +376,7 @@ class CoreConfig:
             }
             CoreConfig.configure_from_dict(config)
         """
-        cls.configure(
+        self.configure(
             db_server=config.get('db_server'),
             db_database=config.get('db_database'),
             db_user=config.get('db_user'),
@@ -194,6 +384,19 @@ class CoreConfig:
             db_driver=config.get('db_driver'),
             load_from_env=config.get('load_from_env', True)
         )
-        
+
         if 'custom_regex' in config:
-            cls.register_multiple_regex(config['custom_regex'])
+            self.register_multiple_regex(config['custom_regex'])
+
+# Instância única: chamadas existentes (CoreConfig.configure(...)) continuam
+# funcionando, agora resolvendo atributos por slot em vez de classmethod
+CoreConfig = _CoreConfig()
+
+# Bound methods criados uma única vez: hot paths podem importar a função
+# direto (from SQLManager.CoreConfig import get_compiled_regex) e pular a
+# resolução de atributo por chamada
+get_regex          = CoreConfig.get_regex
+get_compiled_regex = CoreConfig.get_compiled_regex
+has_regex          = CoreConfig.has_regex
+get_db_config      = CoreConfig.get_db_config
+is_configured      = CoreConfig.is_configured
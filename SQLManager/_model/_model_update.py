@@ -3,11 +3,143 @@ Atualização automática de modelos (EDTs, Enums e Tables)
 Lê banco de dados e sincroniza com aplicação, gerando __init__.py automaticamente
 '''
 
+import ast
+import os
+import re
 import sys
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 ROOT_DIR = Path(__file__).parent.parent.parent.parent
 
+# Padrões compilados uma única vez (os scanners rodam 4x por run); bytes
+# porque o nome da classe é ASCII e dispensa decodificar o arquivo inteiro
+_CLASS_RE      = re.compile(rb'^class\s+(\w+)\s*\(', re.MULTILINE)
+_ENUM_CLASS_RE = re.compile(rb'^class\s+(\w+)\s*\(\s*BaseEnumController\.Enum\s*\)', re.MULTILINE)
+
+# Coluna normalizada uma única vez (nome em maiúsculas, tipo em minúsculas)
+# para não repetir .upper()/.lower() em cada passada do codegen
+_Col = namedtuple('_Col', 'name sql_type nullable max_length')
+
+# Tipos SQL que carregam limite de tamanho (consultado por coluna)
+_LEN_SQL_TYPES = frozenset({'varchar', 'nvarchar', 'char', 'nchar'})
+
+# Queries fixas do sync de tabelas
+_TABLES_QUERY = """
+    SELECT TABLE_NAME
+    FROM INFORMATION_SCHEMA.TABLES
+    WHERE TABLE_TYPE = 'BASE TABLE'
+    ORDER BY TABLE_NAME
+"""
+
+# Uma única query traz as colunas de todas as tabelas (evita N
+# round-trips ao SQL Server, um por tabela)
+_COLUMNS_QUERY = """
+    SELECT TABLE_NAME, COLUMN_NAME, DATA_TYPE, IS_NULLABLE, CHARACTER_MAXIMUM_LENGTH
+    FROM INFORMATION_SCHEMA.COLUMNS
+    WHERE TABLE_NAME IN (
+        SELECT TABLE_NAME FROM INFORMATION_SCHEMA.TABLES WHERE TABLE_TYPE = 'BASE TABLE'
+    )
+    ORDER BY TABLE_NAME, ORDINAL_POSITION
+"""
+
+# Serializa os prints dos workers de codegen (as mensagens de cada tabela
+# saem inteiras, sem intercalar)
+_print_lock = threading.Lock()
+
+# Conteúdo fixo dos __init__.py zerados, codificado uma única vez no import
+_EMPTY_INIT_BYTES = "# Auto-generated file - será atualizado automaticamente\n\n__all__ = []\n".encode('utf-8')
+
+def _write_if_changed(path: Path, content) -> bool:
+    '''Escreve o arquivo apenas se o conteúdo mudou (reruns idempotentes não tocam o disco)'''
+    new_bytes = content if isinstance(content, bytes) else content.encode('utf-8')
+    try:
+        if path.read_bytes() == new_bytes:
+            return False
+    except FileNotFoundError:
+        pass
+    # Escrita atômica: um processo morto no meio do run nunca deixa um .py
+    # truncado para trás (os.replace é atômico no mesmo filesystem)
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    tmp_path.write_bytes(new_bytes)
+    os.replace(tmp_path, path)
+    return True
+
+def _build_init_content(file_to_class: dict, export_names) -> str:
+    '''Monta o conteúdo de um __init__.py gerado num único join'''
+    imports = "\n".join(f"from .{file_name} import {class_name}" for file_name, class_name in file_to_class.items())
+    exports = "".join(f'    "{name}",\n' for name in export_names)
+    return f"{imports}\n\n__all__ = [\n{exports}]"
+
+def _should_preserve(existing_def: str) -> bool:
+    '''
+    Campo apontando para EDT/Enum customizado deve ser mantido
+    (Enum_cls genérico não conta como customização)
+    '''
+    return ('EDTPack.' in existing_def or 'EnumPack.' in existing_def) and 'Enum_cls' not in existing_def
+
+def _parse_existing_table(source: str, table_name: str):
+    '''
+    Extrai campos do __init__ e métodos customizados numa única passada de AST
+    (substitui três varreduras de regex e lê corretamente self.X multilinha)
+    Returns: (existing_fields, custom_methods)
+    '''
+    existing_fields = {}
+    custom_methods = []
+
+    class_node = next(
+        (node for node in ast.parse(source).body
+         if isinstance(node, ast.ClassDef) and node.name == table_name),
+        None
+    )
+    if class_node is None:
+        return existing_fields, custom_methods
+
+    source_lines = source.splitlines()
+
+    for node in class_node.body:
+        if not isinstance(node, ast.FunctionDef):
+            continue
+        if node.name == '__init__':
+            for stmt in node.body:
+                if isinstance(stmt, ast.Assign):
+                    for target in stmt.targets:
+                        if isinstance(target, ast.Attribute) and isinstance(target.value, ast.Name) and target.value.id == 'self':
+                            existing_fields[target.attr] = ast.get_source_segment(source, stmt.value)
+        else:
+            # Emite a partir do primeiro decorador: o lineno do FunctionDef
+            # aponta para o 'def', e um @property/@staticmethod preservado
+            # voltaria como método comum na próxima regeneração
+            start = node.decorator_list[0].lineno if node.decorator_list else node.lineno
+            custom_methods.append("\n".join(source_lines[start - 1:node.end_lineno]))
+
+    return existing_fields, custom_methods
+
+def _scan_model_files(path: Path):
+    '''Lista arquivos .py de modelo (ignora privados e __init__) via os.scandir'''
+    with os.scandir(path) as it:
+        return [
+            entry for entry in it
+            if entry.is_file() and entry.name.endswith('.py') and not entry.name.startswith('_')
+        ]
+
+def _scan_dir(path: Path, pattern: re.Pattern):
+    '''
+    Varredura genérica de um diretório de modelos: extrai o nome da classe
+    de cada arquivo com o regex pré-compilado recebido
+    Returns: lista de (file_name, class_name, entry)
+    '''
+    results = []
+    for entry in _scan_model_files(path):
+        file_name = entry.name[:-3]
+        with open(entry.path, 'rb') as f:
+            match = pattern.search(f.read())
+        class_name = match.group(1).decode('ascii') if match else file_name
+        results.append((file_name, class_name, entry))
+    return results
+
 class utils:
     '''Funções utilitárias'''
     
@@ -25,14 +157,12 @@ class utils:
         
         for init_file in init_files:
             if init_file.exists():
-                with open(init_file, 'w', encoding='utf-8') as f:
-                    f.write("# Auto-generated file - será atualizado automaticamente\n\n__all__ = []\n")
+                init_file.write_bytes(_EMPTY_INIT_BYTES)
 
 
     @staticmethod
     def stepInfo(_step: str, _desc: str):
-        from SQLManager import SystemController
-        print(f"\n[{SystemController().custom_text(_step, 'cyan', is_bold=True)}] {_desc}...")
+        print(f"\n[{_custom_text(_step, 'cyan', is_bold=True)}] {_desc}...")
 
 sys.dont_write_bytecode = True
 src_dir = ROOT_DIR / "src"
@@ -47,6 +177,16 @@ utils._clear_init_files_pre_import(ROOT_DIR)
 
 from SQLManager import CoreConfig, database_connection, SystemController
 
+# custom_text é estático: uma única referência evita instanciar
+# SystemController() a cada print; tokens fixos já saem colorizados prontos
+_custom_text = SystemController.custom_text
+
+_TXT_ATENCAO   = _custom_text('ATENÇÃO', 'red', is_bold=True)
+_TXT_REMOVIDAS = _custom_text('REMOVIDAS', 'red', is_bold=True)
+_TXT_BACKUP    = _custom_text('BACKUP', 'yellow', is_bold=True)
+_TXT_YES       = _custom_text('y', 'green')
+_TXT_NO        = _custom_text('n', 'red')
+
 if not CoreConfig.is_configured():
     CoreConfig.configure(
         db_server=os.getenv('DB_SERVER'),
@@ -56,10 +196,8 @@ if not CoreConfig.is_configured():
         db_driver=os.getenv('DB_DRIVER', 'ODBC Driver 17 for SQL Server')
     )
 
-def ensure_datatype_enum(enum_path):
-    '''Garante que Enum DataType exista'''
-    datatype_file = enum_path / "DataType.py"
-    datatype_code = '''from typing import Self
+# Templates fixos, codificados uma única vez no import
+_DATATYPE_ENUM_BYTES = '''from typing import Self
 from SQLManager import BaseEnumController
 
 class DataType(BaseEnumController.Enum):
@@ -81,14 +219,9 @@ class DataType(BaseEnumController.Enum):
     Date     : Self = ("date",      "Tipo de dado Data (YYYY-MM-DD)")
     DateTime : Self = ("datetime",  "Tipo de dado Data/Hora (YYYY-MM-DD HH:MM:SS)")
     Undefined: Self = ("undefined", "Tipo de dado Indefinido")
-'''
-    with open(datatype_file, 'w', encoding='utf-8') as f:
-        f.write(datatype_code)
+'''.encode('utf-8')
 
-def ensure_recid_edt(edts_path):
-    '''Garante que EDT Recid exista'''
-    recid_file = edts_path / "Recid.py"
-    recid_code = '''from SQLManager import EDTController
+_RECID_EDT_BYTES = '''from SQLManager import EDTController
 from model.enum import DataType
 
 class Recid(EDTController):
@@ -99,9 +232,15 @@ class Recid(EDTController):
     """
     def __init__(self, value: EDTController.any_type = 0):
         super().__init__("onlyNumbers", DataType.Number, value)
-'''
-    with open(recid_file, 'w', encoding='utf-8') as f:
-        f.write(recid_code)
+'''.encode('utf-8')
+
+def ensure_datatype_enum(enum_path):
+    '''Garante que Enum DataType exista'''
+    _write_if_changed(enum_path / "DataType.py", _DATATYPE_ENUM_BYTES)
+
+def ensure_recid_edt(edts_path):
+    '''Garante que EDT Recid exista'''
+    _write_if_changed(edts_path / "Recid.py", _RECID_EDT_BYTES)
 
 class ModelUpdater:
     '''Atualização automática de modelos'''
@@ -119,13 +258,14 @@ class ModelUpdater:
             "    \"TablePack\",\n"
             "]\n"
         )
-        with open(model_init_file, 'w', encoding='utf-8') as f:
-            f.write(content)
+        _write_if_changed(model_init_file, content)
 
     def __init__(self):
+        # Conexão adiada: run() pode ser cancelado no prompt antes de
+        # qualquer query, então só conecta quando _update_tables precisar
         self.db = database_connection()
-        self.db.connect()
-        
+        self._db_connected = False
+
         project_root = Path.cwd()
         self.model_path  = project_root / "src" / "model"
         self.edts_path   = self.model_path  / "EDTs"
@@ -166,10 +306,51 @@ class ModelUpdater:
             'date':         ('str', 'DataType.String'),
             'time':         ('str', 'DataType.String'),
         }
+
+        # Memoização por run do código gerado: chave (table_name, colunas),
+        # reprocessar a mesma tabela vira um lookup
+        self._gen_cache = {}
+
+        # Buffer de progresso: uma escrita no stdout a cada lote de linhas
+        # em vez de um print por tabela (consoles lentos dominam o tempo)
+        self._pending_prints = []
+
+        # Visão achatada consultada por coluna no codegen: um único .get
+        # resolve tipo python, nome do DataType e se o tipo carrega limite
+        self.sql_type_flat = {
+            sql_type: (python_type, datatype.split('.')[-1], sql_type in _LEN_SQL_TYPES)
+            for sql_type, (python_type, datatype) in self.sql_type_mapping.items()
+        }
     
+    _PRINT_BATCH = 64
+
+    def _log(self, line: str):
+        '''Enfileira uma linha de progresso; descarrega o lote quando cheio'''
+        with _print_lock:
+            self._pending_prints.append(line)
+            if len(self._pending_prints) >= self._PRINT_BATCH:
+                self._flush_prints_locked()
+
+    def _flush_prints_locked(self):
+        if self._pending_prints:
+            sys.stdout.write("\n".join(self._pending_prints) + "\n")
+            sys.stdout.flush()
+            self._pending_prints.clear()
+
+    def _flush_prints(self):
+        '''Descarrega as linhas de progresso pendentes'''
+        with _print_lock:
+            self._flush_prints_locked()
+
+    def _ensure_db(self):
+        '''Abre a conexão com o banco na primeira necessidade'''
+        if not self._db_connected:
+            self.db.connect()
+            self._db_connected = True
+
     def __del__(self):
         '''Fecha conexão ao destruir objeto'''
-        if hasattr(self, 'db'):
+        if getattr(self, '_db_connected', False):
             self.db.disconnect()
     
     def _clear_init_files(self):
@@ -181,10 +362,9 @@ class ModelUpdater:
         ]
         
         for init_file in init_files:
-            with open(init_file, 'w', encoding='utf-8') as f:
-                f.write("# Auto-generated file - será atualizado automaticamente\n\n__all__ = []\n")
+            init_file.write_bytes(_EMPTY_INIT_BYTES)
         
-        print(SystemController().custom_text("Arquivos __init__.py limpos", "red", is_bold=True))
+        print(_custom_text("Arquivos __init__.py limpos", "red", is_bold=True))
     
     def run(self):
         '''Executa atualização completa'''
@@ -196,10 +376,10 @@ class ModelUpdater:
         existing_tables = [f for f in existing_tables if not f.name.startswith("_")]
         
         if existing_tables:
-            print(f"\n{SystemController().custom_text('ATENÇÃO', 'red', is_bold=True)}")
-            print(f"Tabelas não existentes no banco serão {SystemController().custom_text('REMOVIDAS', 'red', is_bold=True)}.")
-            print(f"Faça {SystemController().custom_text('BACKUP', 'yellow', is_bold=True)} de src/model/tables antes de continuar.")
-            print(f"\nContinuar? ({SystemController().custom_text('y', 'green')}/{SystemController().custom_text('n', 'red')})")
+            print(f"\n{_TXT_ATENCAO}")
+            print(f"Tabelas não existentes no banco serão {_TXT_REMOVIDAS}.")
+            print(f"Faça {_TXT_BACKUP} de src/model/tables antes de continuar.")
+            print(f"\nContinuar? ({_TXT_YES}/{_TXT_NO})")
             resposta = input().strip().lower()
             if resposta != "y":
                 print("Cancelado.")
@@ -237,7 +417,6 @@ class ModelUpdater:
             Table_Manager._update_tables(self)
 
             utils.stepInfo("03.3", "Atualizando model de Tables")
-            Table_Manager._scan_existing_tables(self, _ShowTables=True)
             Table_Manager._update_tables_init(self)
 
             print("\n" + "="*40)
@@ -253,50 +432,24 @@ class EDT_Manager:
     
     def _scan_existing_edts(_model: ModelUpdater, _ShowEDTs: bool = False):
         '''Escaneia EDTs existentes no diretório'''
-        import re
-        
-        for file in _model.edts_path.glob("*.py"):
-            if file.name.startswith("_") or file.name == "__init__.py":
-                continue
-                        
-            file_name = file.stem
-            with open(file, 'r', encoding='utf-8') as f:
-                content = f.read()                
-                match = re.search(r'^class\s+(\w+)\s*\(', content, re.MULTILINE)
-                if match:
-                    class_name = match.group(1)
-                else:                    
-                    class_name = file_name
-            
+        for file_name, class_name, _entry in _scan_dir(_model.edts_path, _CLASS_RE):
             _model.available_edts[class_name.upper()] = class_name
             _model.edt_file_to_class[file_name] = class_name
         
-        print(f"Encontrados: {SystemController().custom_text(len(_model.available_edts), 'red', is_bold=True)} EDTs")
+        print(f"Encontrados: {_custom_text(len(_model.available_edts), 'red', is_bold=True)} EDTs")
 
         if(_ShowEDTs):
             print("Lista de EDTs encontrados:")
             for edt in _model.available_edts.values():
-                print(f" - {SystemController().custom_text(edt, 'green', is_bold=True)}")
+                print(f" - {_custom_text(edt, 'green', is_bold=True)}")
                 
     def _update_edts_init(_model: ModelUpdater):
         '''Atualiza __init__.py dos EDTs'''
         init_file = _model.edts_path / "__init__.py"
-                
-        lines = []
-        for file_name, class_name in _model.edt_file_to_class.items():
-            lines.append(f"from .{file_name} import {class_name}")
-
-        lines.append("")
-        lines.append("__all__ = [")
 
-        for edt in _model.available_edts.values():
-            lines.append(f"    \"{edt}\",")
+        content = _build_init_content(_model.edt_file_to_class, _model.available_edts.values())
 
-        lines.append("]")                    
-        content = "\n".join(lines)
-        
-        with open(init_file, 'w', encoding='utf-8') as f:
-            f.write(content)
+        _write_if_changed(init_file, content)
         
         print(f"Pacote de EDTs atualizado: {init_file}")
 
@@ -305,50 +458,24 @@ class Enum_Manager:
 
     def _scan_existing_enums(_model: ModelUpdater, _ShowEnums: bool = False):
         '''Escaneia Enums existentes no diretório'''
-        import re
-        
-        for file in _model.enums_path.glob("*.py"):
-            if file.name.startswith("_") or file.name == "__init__.py":
-                continue
-                        
-            file_name = file.stem
-            with open(file, 'r', encoding='utf-8') as f:
-                content = f.read()                                
-                match = re.search(r'^class\s+(\w+)\s*\(\s*BaseEnumController\.Enum\s*\)', content, re.MULTILINE)
-                if match:
-                    class_name = match.group(1)
-                else:                    
-                    class_name = file_name
-            
+        for file_name, class_name, _entry in _scan_dir(_model.enums_path, _ENUM_CLASS_RE):
             _model.available_enums[class_name.upper()] = class_name
             _model.enum_file_to_class[file_name] = class_name
         
-        print(f"Encontrados {SystemController().custom_text(len(_model.available_enums), 'red', is_bold=True)} Enums")
+        print(f"Encontrados {_custom_text(len(_model.available_enums), 'red', is_bold=True)} Enums")
 
         if(_ShowEnums):
             print("Lista de Enums encontrados:")
             for enum in _model.available_enums.values():
-                print(f" - {SystemController().custom_text(enum, 'green', is_bold=True)}")
+                print(f" - {_custom_text(enum, 'green', is_bold=True)}")
 
     def _update_enums_init(_model: ModelUpdater):
         '''Atualiza __init__.py dos Enums'''
         init_file = _model.enums_path / "__init__.py"
-                
-        lines = []
-        for file_name, class_name in _model.enum_file_to_class.items():
-            lines.append(f"from .{file_name} import {class_name}")
 
-        lines.append("")
-        lines.append("__all__ = [")
-
-        for enum in _model.available_enums.values():
-            lines.append(f"    \"{enum}\",")
+        content = _build_init_content(_model.enum_file_to_class, _model.available_enums.values())
 
-        lines.append("]")                    
-        content = "\n".join(lines)
-        
-        with open(init_file, 'w', encoding='utf-8') as f:
-            f.write(content)
+        _write_if_changed(init_file, content)
         
         print(f"Pacote de Enums atualizado: {init_file}")
 
@@ -357,52 +484,63 @@ class Table_Manager:
     
     def _scan_existing_tables(_model: ModelUpdater, _ShowTables: bool = False):
         '''Escaneia Tables existentes no diretório'''
-        import re
-        
-        for file in _model.tables_path.glob("*.py"):
-            if file.name.startswith("_") or file.name == "__init__.py":
-                continue
-                        
-            file_name = file.stem
-            with open(file, 'r', encoding='utf-8') as f:
-                content = f.read()                
-                match = re.search(r'^class\s+(\w+)\s*\(', content, re.MULTILINE)
-                if match:
-                    class_name = match.group(1)
-                else:                    
-                    class_name = file_name
-            
-            _model.available_tables[class_name] = file
+        for file_name, class_name, entry in _scan_dir(_model.tables_path, _CLASS_RE):
+            _model.available_tables[class_name] = Path(entry.path)
             _model.table_file_to_class[file_name] = class_name
         
-        print(f"Encontrados {SystemController().custom_text(len(_model.available_tables), 'red', is_bold=True)} Tables")
+        print(f"Encontrados {_custom_text(len(_model.available_tables), 'red', is_bold=True)} Tables")
 
         if(_ShowTables):
             print("Lista de Tables encontrados:")
-            for table in _model.available_tables.keys():
+            for table in _model.available_tables:
                 print(f" - {table}")
 
     def _update_tables(_model: ModelUpdater):
-        '''Atualiza Tables baseadas no banco de dados'''        
-        query = """
-            SELECT TABLE_NAME 
-            FROM INFORMATION_SCHEMA.TABLES 
-            WHERE TABLE_TYPE = 'BASE TABLE'
-            ORDER BY TABLE_NAME
-        """
-        
-        tables = _model.db.doQuery(query)
+        '''Atualiza Tables baseadas no banco de dados'''
+        _model._ensure_db()
+
+        tables = _model.db.doQuery(_TABLES_QUERY)
         db_tables = [row[0] for row in tables]
-        
-        print(f"Encontradas {SystemController().custom_text(len(db_tables), 'red', is_bold=True)} tabelas no banco de dados")                        
-        
+
+        print(f"Encontradas {_custom_text(len(db_tables), 'red', is_bold=True)} tabelas no banco de dados")
+
+        # O resultado vem ordenado por TABLE_NAME: cada grupo de colunas é
+        # submetido ao pool assim que fecha, sobrepondo a geração/escrita das
+        # primeiras tabelas com a iteração do restante do result set
         skipped_tables = []
-        for table_name in db_tables:
-            error_info = Table_Manager._update_single_table(_model, table_name)
-            if error_info:
-                skipped_tables.append(error_info)
+        known_tables = set(db_tables)
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            futures = []
+            seen_tables = set()
+
+            def _submit(table_name, columns):
+                seen_tables.add(table_name)
+                futures.append(executor.submit(Table_Manager._update_single_table, _model, table_name, columns))
+
+            current_table = None
+            current_columns = []
+            for row in _model.db.doQuery(_COLUMNS_QUERY):
+                if row[0] != current_table:
+                    if current_table in known_tables:
+                        _submit(current_table, current_columns)
+                    current_table, current_columns = row[0], []
+                current_columns.append(row[1:])
+            if current_table in known_tables:
+                _submit(current_table, current_columns)
+
+            # Tabelas sem colunas no result set ainda passam pelo caminho de erro
+            for table_name in db_tables:
+                if table_name not in seen_tables:
+                    _submit(table_name, [])
+
+            for future in as_completed(futures):
+                error_info = future.result()
+                if error_info:
+                    skipped_tables.append(error_info)
+
+        _model._flush_prints()
                 
-        db_tables_lower = set(t.lower() for t in db_tables)
+        db_tables_lower = {t.lower() for t in db_tables}
                 
         tables_to_remove = [
             (table_name, file_path)
@@ -411,7 +549,7 @@ class Table_Manager:
         ]
 
         for table_name, file_path in tables_to_remove:
-            print(f"\nTabela '{SystemController().custom_text(table_name, 'red')}' removida da aplicação pois não existe no banco de dados!")
+            print(f"\nTabela '{_custom_text(table_name, 'red')}' removida da aplicação pois não existe no banco de dados!")
             file_path.unlink()
             if table_name in _model.available_tables:
                 del _model.available_tables[table_name]
@@ -420,117 +558,84 @@ class Table_Manager:
                 del _model.table_file_to_class[file_stem]
         
         if skipped_tables:
-            print(f"\n{SystemController().custom_text('TABELAS NÃO PROCESSADAS', 'yellow', is_bold=True)}")
+            print(f"\n{_custom_text('TABELAS NÃO PROCESSADAS', 'yellow', is_bold=True)}")
             print("="*60)
             for error_info in skipped_tables:
-                print(f"{SystemController().custom_text('Tabela:', 'cyan')} {error_info['table']}")
-                print(f"{SystemController().custom_text('Motivo:', 'red')} {error_info['reason']}")
+                print(f"{_custom_text('Tabela:', 'cyan')} {error_info['table']}")
+                print(f"{_custom_text('Motivo:', 'red')} {error_info['reason']}")
                 print("-"*60)
-        
-        Table_Manager._scan_existing_tables(_model, _ShowTables=True)
 
     def _update_tables_init(_model: ModelUpdater):
         '''Atualiza __init__.py de tables'''
         init_file = _model.tables_path / "__init__.py"
-                
-        lines = []
-        for file_name, class_name in _model.table_file_to_class.items():
-            lines.append(f"from .{file_name} import {class_name}")
-
-        lines.append("")
-        lines.append("__all__ = [")
 
-        for table in _model.available_tables.keys():
-            lines.append(f"    \"{table}\",")
+        content = _build_init_content(_model.table_file_to_class, _model.available_tables)
 
-        lines.append("]")                    
-        content = "\n".join(lines)
-        
-        with open(init_file, 'w', encoding='utf-8') as f:
-            f.write(content)
+        _write_if_changed(init_file, content)
         
         print(f"Pacote de Tables atualizado: {init_file}")
 
-    def _update_single_table(_model: ModelUpdater, table_name: str):
+    def _update_single_table(_model: ModelUpdater, table_name: str, columns):
         '''
-        Atualiza/Cria tabela específica
+        Atualiza/Cria tabela específica a partir das colunas pré-carregadas
         Returns: Dict com erro ou None se sucesso
-        '''        
-        query = """
-            SELECT COLUMN_NAME, DATA_TYPE, IS_NULLABLE, CHARACTER_MAXIMUM_LENGTH
-            FROM INFORMATION_SCHEMA.COLUMNS
-            WHERE TABLE_NAME = ?
-            ORDER BY ORDINAL_POSITION
-        """
-        
-        columns = _model.db.doQuery(query, (table_name,))
-        
+        '''
         if not columns:
             return {'table': table_name, 'reason': 'Tabela sem colunas'}
-        
-        recid_column = None
-        for col in columns:
-            if col[0].upper() == 'RECID':
-                recid_column = col
-                break
-        
+
+        cols = [_Col(col[0].upper(), col[1].lower(), col[2], col[3]) for col in columns]
+
+        recid_column = next((col for col in cols if col.name == 'RECID'), None)
+
         if not recid_column:
             return {'table': table_name, 'reason': 'Campo RECID obrigatório não encontrado'}
-                
-        recid_type = recid_column[1].lower()
-        if recid_type != 'bigint':
-            return {'table': table_name, 'reason': f'Campo RECID deve ser BIGINT (encontrado: {recid_type.upper()})'}
-        
+
+        if recid_column.sql_type != 'bigint':
+            return {'table': table_name, 'reason': f'Campo RECID deve ser BIGINT (encontrado: {recid_column.sql_type.upper()})'}
+
         table_file = _model.tables_path / f"{table_name}.py"
-        
+
         try:
-            if table_file.exists():
-                table_code = Table_Manager._update_existing_table(_model, table_name, columns, table_file)
-            else:
-                table_code = Table_Manager._generate_table_class(_model, table_name, columns)
-                    
-            with open(table_file, 'w', encoding='utf-8') as f:
-                f.write(table_code)
-            
-            print(f"Atualizada: {SystemController().custom_text(table_name, 'green', is_bold=True)}")
+            cache_key = (table_name, tuple(cols))
+            table_code = _model._gen_cache.get(cache_key)
+
+            if table_code is None:
+                if table_file.exists():
+                    table_code = Table_Manager._update_existing_table(_model, table_name, cols, table_file)
+                else:
+                    table_code = Table_Manager._generate_table_class(_model, table_name, cols)
+                _model._gen_cache[cache_key] = table_code
+
+            if _write_if_changed(table_file, table_code):
+                _model._log(f"Atualizada: {_custom_text(table_name, 'green', is_bold=True)}")
+
+            # Mantém os mapas em dia sem re-escanear o diretório ao final
+            _model.available_tables[table_name] = table_file
+            _model.table_file_to_class[table_name] = table_name
             return None
         except Exception as e:
             return {'table': table_name, 'reason': f'Erro ao gerar código: {str(e)}'}
     
     def _update_existing_table(_model: ModelUpdater, table_name: str, columns, table_file: Path) -> str:
         '''Atualiza tabela existente preservando métodos customizados'''
-        import re
-        
-        with open(table_file, 'r', encoding='utf-8') as f:
-            existing_content = f.read()
-        
-        existing_fields = {}
-        field_pattern = r'self\.(\w+)\s*=\s*(.+)'
-        for match in re.finditer(field_pattern, existing_content):
-            field_name = match.group(1)
-            field_value = match.group(2).strip()
-            existing_fields[field_name] = field_value
-        
+        existing_content = table_file.read_text(encoding='utf-8')
+
+        existing_fields, custom_methods = _parse_existing_table(existing_content, table_name)
+
         new_fields = {}
         db_field_names = set()
         updated_fields = []
         
         for col in columns:
-            col_name = col[0].upper()
-            sql_type = col[1].lower()
-            max_length = col[3]
+            col_name = col.name
             db_field_names.add(col_name)
-            
-            new_field_type = Table_Manager._detect_field_type(_model, col_name, sql_type, max_length)
+
+            new_field_type = Table_Manager._detect_field_type(_model, col_name, col.sql_type, col.max_length)
             
             if col_name in existing_fields:
                 existing_def = existing_fields[col_name]
-                
-                # Verifica se tem EDT/Enum customizado específico
-                has_custom_edt = 'EDTPack.' in existing_def and existing_def != new_field_type
-                has_custom_enum = 'EnumPack.' in existing_def and 'Enum_cls' not in existing_def and existing_def != new_field_type
-                
-                if has_custom_edt or has_custom_enum:
+
+                if existing_def != new_field_type and _should_preserve(existing_def):
                     # Mantém customização específica
                     new_fields[col_name] = existing_def
                 else:
@@ -542,30 +647,18 @@ class Table_Manager:
                 # Campo novo
                 new_fields[col_name] = new_field_type
         
-        existing_field_names = set(existing_fields.keys())
+        existing_field_names = set(existing_fields)
         
         new_field_names = db_field_names - existing_field_names
         if new_field_names:
-            print(f"  - Tabela {SystemController().custom_text(table_name, 'cyan')}: {SystemController().custom_text('Campos adicionados', 'yellow')} - {', '.join(sorted(new_field_names))}")
-        
+            _model._log(f"  - Tabela {_custom_text(table_name, 'cyan')}: {_custom_text('Campos adicionados', 'yellow')} - {', '.join(sorted(new_field_names))}")
+
         if updated_fields:
-            print(f"  - Tabela {SystemController().custom_text(table_name, 'cyan')}: {SystemController().custom_text('Campos atualizados com EDT/Enum', 'green')} - {', '.join(sorted(updated_fields))}")
-        
+            _model._log(f"  - Tabela {_custom_text(table_name, 'cyan')}: {_custom_text('Campos atualizados com EDT/Enum', 'green')} - {', '.join(sorted(updated_fields))}")
+
         removed_field_names = existing_field_names - db_field_names
         if removed_field_names:
-            print(f"  - Tabela {SystemController().custom_text(table_name, 'cyan')}: {SystemController().custom_text('Campos removidos do banco', 'red')} - {', '.join(sorted(removed_field_names))}")
-        
-        init_end_pattern = r'(self\.\w+\s*=\s*.+?)(\n\n|\n    def |\nclass |\Z)'
-        matches = list(re.finditer(init_end_pattern, existing_content, re.DOTALL))
-        
-        custom_methods = ""
-        if matches:
-            last_field_end = matches[-1].end(1)
-            rest_of_file = existing_content[last_field_end:]
-            custom_pattern = r'(\n    def (?!__init__)\w+.+?)(?=\nclass |\Z)'
-            custom_match = re.search(custom_pattern, rest_of_file, re.DOTALL)
-            if custom_match:
-                custom_methods = custom_match.group(1)
+            _model._log(f"  - Tabela {_custom_text(table_name, 'cyan')}: {_custom_text('Campos removidos do banco', 'red')} - {', '.join(sorted(removed_field_names))}")
         
         lines = []
         lines.append("from SQLManager import TableController, EDTController")
@@ -583,65 +676,55 @@ class Table_Manager:
         lines.append("    ")
         
         for col in columns:
-            col_name = col[0].upper()
-            if col_name in new_fields:
-                lines.append(f"        self.{col_name} = {new_fields[col_name]}")
+            if col.name in new_fields:
+                lines.append(f"        self.{col.name} = {new_fields[col.name]}")
         
         lines.append("")
         
         if custom_methods:
-            lines.append(custom_methods.rstrip())
+            lines.append("\n\n".join(method.rstrip() for method in custom_methods))
             lines.append("")
         
         return "\n".join(lines)
     
     def _generate_table_class(_model: ModelUpdater, table_name: str, columns) -> str:
         '''Gera código Python para classe de tabela'''
-        lines = []
-                
-        lines.append("from SQLManager import TableController, EDTController")
-        lines.append("from model import EDTPack, EnumPack")        
-        lines.append("")
-                
-        lines.append(f"class {table_name}(TableController):")
-        lines.append("    ")
-        lines.append("    '''")
-        lines.append(f"    Tabela: {table_name}")
-        lines.append("    args:")
-        lines.append("        db_controller: Banco de dados ou transação")
-        lines.append("    '''")
-        lines.append("    def __init__(self, db):")
-        lines.append(f"        super().__init__(db=db, table_name=\"{table_name}\")")
-        lines.append("    ")
-                
-        for col in columns:
-            col_name = col[0].upper()
-            sql_type = col[1].lower()
-            max_length = col[3]
-                        
-            field_def = Table_Manager._detect_field_type(_model, col_name, sql_type, max_length)
-            lines.append(f"        self.{col_name} = {field_def}")
-        
-        lines.append("")
-        
-        return "\n".join(lines)
+        field_lines = "\n".join(
+            f"        self.{col.name} = {Table_Manager._detect_field_type(_model, col.name, col.sql_type, col.max_length)}"
+            for col in columns
+        )
+
+        return (
+            "from SQLManager import TableController, EDTController\n"
+            "from model import EDTPack, EnumPack\n"
+            "\n"
+            f"class {table_name}(TableController):\n"
+            "    \n"
+            "    '''\n"
+            f"    Tabela: {table_name}\n"
+            "    args:\n"
+            "        db_controller: Banco de dados ou transação\n"
+            "    '''\n"
+            "    def __init__(self, db):\n"
+            f"        super().__init__(db=db, table_name=\"{table_name}\")\n"
+            "    \n"
+            f"{field_lines}\n"
+        )
         
     def _detect_field_type(_model: ModelUpdater, field_name: str, sql_type: str, max_length) -> str:
         '''Detecta tipo de campo apropriado (EDT, Enum ou padrão)'''
                 
         if field_name in _model.available_edts:
             return f"EDTPack.{_model.available_edts[field_name]}()"
-                    
+
         if field_name in _model.available_enums:
             return f"EnumPack.{_model.available_enums[field_name]}()"
-                
-        python_type, datatype = _model.sql_type_mapping.get(sql_type, ('str', 'DataType.String'))
-                
-        datatype_name = datatype.split('.')[-1]
 
-        if sql_type in ('varchar', 'nvarchar', 'char', 'nchar') and max_length:
+        python_type, datatype_name, has_length = _model.sql_type_flat.get(sql_type, ('str', 'String', False))
+
+        if has_length and max_length:
             return f"EDTController('any', EnumPack.DataType.{datatype_name}, None, {max_length})"
-    
+
         return f"EDTController('any', EnumPack.DataType.{datatype_name})"
     
 if __name__ == "__main__":
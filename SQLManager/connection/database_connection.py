@@ -1,18 +1,34 @@
+import functools
 import os
 import pyodbc
 import threading
 
-from queue import Queue, Empty
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union, TypeAlias
 from ..CoreConfig import CoreConfig
 
 _Connection: TypeAlias = Union['database_connection', 'Transaction']
 
+@functools.lru_cache(maxsize=None)
+def _resolve_conn_string(server, database, user, password, driver):
+    '''Monta a connection string final (memoizada por combinação de credenciais)'''
+    return (
+        f"DRIVER={{{driver}}};"
+        f"SERVER={server};"
+        f"DATABASE={database};"
+        f"UID={user};"
+        f"PWD={password};"
+        f"Encrypt=no;TrustServerCertificate=yes;"
+    )
+
 class _TTS_Manager:
     '''
     Gerenciador de níveis de transação (TTS)
     '''
-    
+    __slots__ = ()
+
+
     def ttsbegin(self):
         '''Adiciona um nível de transação'''
         if self.tts_level == 0:
@@ -38,23 +54,86 @@ class _Consult_Manager:
     '''
     Gerenciador de consultas (queries) e comandos (execute)
     '''
-    
-    def doQuery(self, query: str, params: tuple = (), ret_cols: bool = False): 
+    __slots__ = ()
+
+    # Cursores reutilizados por SQL (pyodbc reaproveita o plano preparado
+    # quando o mesmo cursor re-executa o mesmo texto); LRU limitado por conexão
+    _STMT_CACHE_SIZE = 128
+
+    def _cursor_for(self, sql: str):
+        '''
+        Retorna (cursor, cacheado) para o SQL na conexão atual
+        SQL visto pela primeira vez ganha um cursor descartável (one-shot não
+        paga manutenção de cache); da 2ª execução em diante o cursor é retido
+        '''
+        conn = self.connection
+        caches = getattr(self, '_stmt_caches', None)
+        if caches is None:
+            caches = self._stmt_caches = {}
+
+        cache = caches.get(id(conn))
+        if cache is None:
+            cache = caches[id(conn)] = OrderedDict()
+
+        entry = cache.get(sql)
+        if entry is None:
+            cache[sql] = [1, None]
+            if len(cache) > self._STMT_CACHE_SIZE:
+                _, oldest = cache.popitem(last=False)
+                if oldest[1] is not None:
+                    try:
+                        oldest[1].close()
+                    except:
+                        pass
+            return conn.cursor(), False
+
+        entry[0] += 1
+        cache.move_to_end(sql)
+
+        cursor = entry[1]
+        if cursor is None:
+            cursor = conn.cursor()
+            try:
+                # Arrays de parâmetros em executemany (uma ida ao servidor
+                # por lote, não por linha); no execute simples é inócuo
+                cursor.fast_executemany = True
+            except:
+                pass
+            entry[1] = cursor
+        return cursor, True
+
+    def _discard_stmt_cache(self, conn):
+        '''Fecha e descarta os cursores cacheados de uma conexão'''
+        caches = getattr(self, '_stmt_caches', None)
+        cache = caches.pop(id(conn), None) if caches else None
+        if cache:
+            for entry in cache.values():
+                if entry[1] is not None:
+                    try:
+                        entry[1].close()
+                    except:
+                        pass
+
+    def doQuery(self, query: str, params: tuple = (), ret_cols: bool = False):
         '''Realiza uma query na conexão'''
-        cursor = self.connection.cursor()
+        cursor, cached = self._cursor_for(query)
         cursor.execute(query, params)
         results = cursor.fetchall()
         columns = [desc[0] for desc in cursor.description]
-        cursor.close()
+        if not cached:
+            cursor.close()
         return (results, columns) if ret_cols else results
-    
-    def executeCommand(self, command: str, params: tuple = ()): 
-        '''Executa um comando na conexão'''
-        cursor = self.connection.cursor()
+
+    def executeCommand(self, command: str, params: tuple = ()):
+        '''Executa um comando na conexão e retorna o total de linhas afetadas'''
+        cursor, cached = self._cursor_for(command)
         cursor.execute(command, params)
+        rowcount = cursor.rowcount
         if isinstance(self, database_connection):
             self.connection.commit()
-        cursor.close()
+        if not cached:
+            cursor.close()
+        return rowcount
 
 class Transaction (_TTS_Manager, _Consult_Manager):
     """
@@ -76,7 +155,8 @@ class Transaction (_TTS_Manager, _Consult_Manager):
 
         O commit ou abort é feito automaticamente ao final do bloco 'with'.
     """
-    
+    __slots__ = ('_db', '_connection', '_tts_level', '_stmt_caches')
+
     def __init__(self, _dbself: 'database_connection'):
         self._db         = _dbself
         self._connection = None
@@ -109,10 +189,14 @@ class Transaction (_TTS_Manager, _Consult_Manager):
         try:
             if exc_type:
                 self.ttsabort()
-            else:
-                while self._tts_level > 0:
-                    self.ttscommit()
+            elif self._tts_level > 0:
+                # Um único commit fecha todos os níveis pendentes (equivale a
+                # N ttscommit, onde só o último tocava a conexão)
+                self._connection.commit()
+                self._connection.autocommit = True
+                self._tts_level = 0
         finally:
+            self._discard_stmt_cache(self._connection)
             self._db._return_connection(self._connection)
             self._connection = None
         return False
@@ -141,7 +225,7 @@ class database_connection (_TTS_Manager, _Consult_Manager):
                 _User:      str = None,
                 _Password:  str = None,
                 _Driver:    str = "ODBC Driver 17 for SQL Server",
-                _pool_size: int = 5, 
+                _pool_size: int = None,
                 _timeout:   int = 30):
         """
         Inicializa a conexão com o banco de dados
@@ -151,7 +235,7 @@ class database_connection (_TTS_Manager, _Consult_Manager):
             _Database: Database (se None, usa CoreConfig ou .env)
             _User: Usuário (se None, usa CoreConfig ou .env)
             _Password: Senha (se None, usa CoreConfig ou .env)
-            _pool_size: Tamanho do pool de conexões
+            _pool_size: Tamanho do pool de conexões (se None, usa DB_POOL_SIZE ou cores*2 + 1)
             _timeout: Timeout para conexões
         
         Ordem de prioridade:
@@ -173,17 +257,23 @@ class database_connection (_TTS_Manager, _Consult_Manager):
             password = _Password or os.getenv('DB_PASSWORD')
             driver   = _Driver   or os.getenv('DB_DRIVER', 'ODBC Driver 17 for SQL Server')
         
-        self.connection_string = (
-            f"DRIVER={{{driver}}};"
-            f"SERVER={server};"
-            f"DATABASE={database};"
-            f"UID={user};"
-            f"PWD={password};"
-            f"Encrypt=no;TrustServerCertificate=yes;"
-        )
-        self._pool    = Queue(maxsize=_pool_size)
-        self._timeout = _timeout
-        self._local   = threading.local() 
+        self.connection_string = _resolve_conn_string(server, database, user, password, driver)
+        # Tamanho padrão pela regra min(32, cores*2 + 1): pools maiores só
+        # enfileiram no servidor (e o warmup abriria dezenas de conexões em
+        # máquinas de muitos núcleos). Overrides explícitos via _pool_size ou
+        # DB_POOL_SIZE não passam pelo teto
+        if _pool_size is None:
+            _pool_size = int(os.getenv('DB_POOL_SIZE', 0)) or min(32, (os.cpu_count() or 4) * 2 + 1)
+
+        # deque + lock curto no lugar de queue.Queue: sem as conditions
+        # not_full/not_empty, o caminho quente segura o mutex só pelo
+        # popleft/append (o cache thread-local continua sendo o fast path)
+        self._pool      = deque()
+        self._pool_lock = threading.Lock()
+        self._pool_max  = _pool_size
+        self._timeout   = _timeout
+        self._warmed    = False
+        self._local     = threading.local()
     
     @property
     def connection(self):
@@ -200,27 +290,73 @@ class database_connection (_TTS_Manager, _Consult_Manager):
         self._local.tts_level = value
     
     def _get_connection(self):
-        '''Pega conexão do pool ou cria nova imediatamente se vazio'''
-        try:
-            return self._pool.get_nowait()
-        except Empty:
-            return pyodbc.connect(self.connection_string)
-    
+        '''Pega conexão do stash da thread, do pool, ou cria nova se vazio'''
+        cached = getattr(self._local, 'cached_return', None)
+        if cached is not None:
+            self._local.cached_return = None
+            return cached
+        with self._pool_lock:
+            if self._pool:
+                return self._pool.popleft()
+        return pyodbc.connect(self.connection_string)
+
     def _return_connection(self, conn):
-        '''Devolve conexão ao pool ou fecha se cheio'''
+        '''
+        Devolve conexão ao pool ou fecha se cheio
+        A primeira devolução fica num stash thread-local (consumido pelo
+        próximo _get_connection da mesma thread sem tocar no _pool_lock);
+        ciclos disconnect/connect na mesma thread viram dois acessos a TLS
+        '''
         if not conn:
             return
         try:
             conn.autocommit = True
-            self._pool.put_nowait(conn)
+            if getattr(self._local, 'cached_return', None) is None:
+                self._local.cached_return = conn
+                return
+            with self._pool_lock:
+                if len(self._pool) < self._pool_max:
+                    self._pool.append(conn)
+                    return
+        except:
+            pass
+        self._discard_stmt_cache(conn)
+        try:
+            conn.close()
         except:
+            pass
+
+    def _warmup(self, n: int):
+        '''
+        Abre n conexões antecipadamente e em paralelo: pyodbc solta a GIL
+        durante o SQLDriverConnect, então DNS/TCP/auth das n conexões se
+        sobrepõem e o cold-start custa ~1 conexão em vez de n
+        '''
+        if n <= 0:
+            return
+
+        def _open(_):
             try:
-                conn.close()
+                return pyodbc.connect(self.connection_string)
             except:
-                pass
+                return None
+
+        with ThreadPoolExecutor(max_workers=n) as executor:
+            for conn in executor.map(_open, range(n)):
+                if conn is None:
+                    continue
+                with self._pool_lock:
+                    if len(self._pool) < self._pool_max:
+                        self._pool.append(conn)
+                        continue
+                conn.close()
 
     def connect(self):
         '''Realiza a conexão atual da thread, ou cria uma nova'''
+        if not self._warmed:
+            self._warmed = True
+            # -1: a conexão da própria thread sai logo abaixo
+            self._warmup(self._pool_max - 1)
         return self.connection
 
     def disconnect(self):
@@ -236,11 +372,15 @@ class database_connection (_TTS_Manager, _Consult_Manager):
             self._local.connection = None
     
     def close_all_connections(self):
-        while not self._pool.empty():
+        with self._pool_lock:
+            conns = list(self._pool)
+            self._pool.clear()
+        for conn in conns:
+            self._discard_stmt_cache(conn)
             try:
-                self._pool.get_nowait().close()
+                conn.close()
             except:
-                break
+                pass
 
     def can_connect(self) -> bool:
         '''Testa se a conexão pode ser estabelecida'''
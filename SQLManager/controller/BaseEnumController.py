@@ -2,34 +2,70 @@ from enum   import Enum as _Enum, EnumMeta as _EnumMeta
 from .operator import OperationManager
 
 class BaseEnum_Utils:
-    '''Classe utilitária para Enums e Controllers'''
-    def _enum_class(self):
-        return getattr(self, 'enum_cls', self)
+    '''
+    Classe utilitária para Enums e Controllers
+    __slots__ vazio mantém as subclasses slotted sem __dict__
+    As projeções (_keys etc.) existem como atributo de classe no enum e nos
+    controllers sintetizados, então os getters são acesso direto; um
+    BaseEnumController instanciado direto (BaseEnumController(MeuEnum)) não
+    as tem na classe e cai no fallback via enum_cls
+    '''
+    __slots__ = ()
 
     def get_keys(self):
-        return [member.name for member in self._enum_class()]
+        try:
+            return list(self._keys)
+        except AttributeError:
+            return list(self.enum_cls._keys)
 
     def get_values(self):
-        return [member.value for member in self._enum_class()]
+        try:
+            return list(self._values)
+        except AttributeError:
+            return list(self.enum_cls._values)
 
     def get_labels(self):
-        return [member.label for member in self._enum_class()]
+        try:
+            return list(self._labels)
+        except AttributeError:
+            return list(self.enum_cls._labels)
 
     def get_map(self):
-        return [{'value': member.value, 'label': member.label} for member in self._enum_class()]
-    
+        try:
+            values, labels = self._values, self._labels
+        except AttributeError:
+            values, labels = self.enum_cls._values, self.enum_cls._labels
+        return [{'value': value, 'label': label} for value, label in zip(values, labels)]
+
     def get_keyByValue(self, value):
-        for member in self._enum_class():
-            if member.value == value:
-                return member.name
-        return None
+        try:
+            member = self.__value_index__.get(value)
+        except AttributeError:
+            member = self.enum_cls.__value_index__.get(value)
+        return member.name if member else None
 
 class CustomEnumMeta(_EnumMeta):
     ''' Metaclass customizada '''
     def __new__(mcs, name, bases, namespace, **kwargs):
         cls = super().__new__(mcs, name, bases, namespace, **kwargs)
                 
-        if bases and any(isinstance(base, CustomEnumMeta) for base in bases):            
+        if bases and any(isinstance(base, CustomEnumMeta) for base in bases):
+            # Índices valor→membro e nome→membro construídos uma única vez:
+            # resolver um valor vira um lookup em dict em vez de varrer o enum
+            cls.__value_index__ = {member.value: member for member in cls}
+            cls.__name_index__  = {member.name: member for member in cls}
+
+            # Primeiro membro e tupla de membros cacheados: o default de um
+            # controller sem valor deixa de materializar list(cls) por chamada
+            cls._members_tuple = tuple(cls)
+            cls._first_member  = cls._members_tuple[0] if cls._members_tuple else None
+
+            # Projeções imutáveis consultadas pelos get_* (a filiação do enum
+            # não muda depois da criação da classe)
+            cls._keys   = tuple(member.name for member in cls)
+            cls._values = tuple(member.value for member in cls)
+            cls._labels = tuple(getattr(member, 'label', None) for member in cls)
+
             annotations = {}
             for member_name in namespace.get('_member_names_', []):
                 annotations[member_name] = cls
@@ -39,52 +75,51 @@ class CustomEnumMeta(_EnumMeta):
                 '__module__': cls.__module__,
                 '__annotations__': annotations.copy()
             }
-                        
+
             cls._controller_stub = type(controller_stub_name, (BaseEnumController,), controller_stub_attrs)
-        
+
+            # Classe de controller sintetizada uma única vez por enum;
+            # __call__ apenas instancia (antes criava uma classe por chamada)
+            # Membros viram atributos de classe do controller: o acesso cai no
+            # caminho C de atributos em vez de interceptação Python por chamada
+            cls._controller_cls = type(f"{name}Controller", (BaseEnumController,), {
+                # 'enum_cls' fica fora do dict da classe: é slot herdado e um
+                # atributo de classe homônimo tornaria o slot inacessível
+                '_enum_cls': cls,
+                '__slots__': (),
+                '__module__': cls.__module__,
+                '__annotations__': annotations.copy(),
+                '__value_index__': cls.__value_index__,
+                '__name_index__': cls.__name_index__,
+                '_keys': cls._keys,
+                '_values': cls._values,
+                '_labels': cls._labels,
+                **{member.name: member for member in cls},
+            })
+
         return cls
     
     def __call__(cls, value=None):
         if isinstance(value, tuple) and len(value) == 2:
             return super().__call__(value)
-                
-        controller_class_name = f"{cls.__name__}Controller"
-                
-        attrs = {
-            'enum_cls': cls,
-            '__module__': cls.__module__
-        }
-                
-        annotations = {}
-        for member in cls:
-            annotations[member.name] = cls
-        
-        attrs['__annotations__'] = annotations
-                
-        controller_cls = type(controller_class_name, (BaseEnumController,), attrs)
-                
-        controller = object.__new__(controller_cls)
+
+        controller = object.__new__(cls._controller_cls)
         controller.enum_cls = cls
         
         if value is None:
-            controller._value = list(cls)[0]
+            controller._value = cls._first_member
+        elif isinstance(value, cls):
+            controller._value = value
         else:
-            controller._value = None            
-            if isinstance(value, cls):
-                controller._value = value
-            elif isinstance(value, str):
-                if hasattr(cls, value):
-                    controller._value = getattr(cls, value)
-                else:
-                    raise ValueError(f'Valor "{value}" inválido para {cls.__name__}')
-            else:            
-                for member in cls:
-                    if member.value == value:
-                        controller._value = member
-                        break
-                if controller._value is None:
-                    raise ValueError(f'Valor "{value}" inválido para {cls.__name__}')
-        
+            member = None
+            if isinstance(value, str):
+                member = cls.__name_index__.get(value)
+            if member is None:
+                member = cls.__value_index__.get(value)
+            if member is None:
+                raise ValueError(f'Valor "{value}" inválido para {cls.__name__}')
+            controller._value = member
+
         return controller
 
 class Enum(BaseEnum_Utils, _Enum, metaclass=CustomEnumMeta):
@@ -101,12 +136,20 @@ class Enum(BaseEnum_Utils, _Enum, metaclass=CustomEnumMeta):
 
 class BaseEnumController(BaseEnum_Utils, OperationManager):
     '''Controlador base para enumerações personalizadas'''
+    # _field_name é injetado pelo TableController.__setattr__
+    __slots__ = ('enum_cls', '_value', '_field_name')
+
     _enum_cls      = None
-    Enum           = Enum    
+    Enum           = Enum
     
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
-    
+        if cls._enum_cls is not None:
+            for member in cls._enum_cls:
+                setattr(cls, member.name, member)
+            for attr in ('__value_index__', '__name_index__', '_keys', '_values', '_labels'):
+                setattr(cls, attr, getattr(cls._enum_cls, attr))
+
     def __init__(self, enum_cls=None, value=None):
         if enum_cls is None:
             enum_cls = self.__class__._enum_cls
@@ -114,7 +157,7 @@ class BaseEnumController(BaseEnum_Utils, OperationManager):
         self._value = None
 
         if value is None:
-            self._value = list(enum_cls)[0]
+            self._value = getattr(enum_cls, '_first_member', None)
         else:
             self.set_value(value)
 
@@ -124,36 +167,6 @@ class BaseEnumController(BaseEnum_Utils, OperationManager):
     def __repr__(self):
         return f"{self.__class__.__name__}({self.value})"
     
-    def __getattribute__(self, name):
-        '''Intercepta todos os acessos a atributos'''
-        # Permitir acesso a atributos internos e métodos especiais
-        if name.startswith('_') or name in ('enum_cls', 'value', 'label', 'key', 'set_value', 
-                                              'get_keys', 'get_values', 'get_labels', 'get_map',
-                                              '__class__', '__dict__'):
-            return object.__getattribute__(self, name)
-        
-        # Tentar pegar do objeto primeiro
-        try:
-            return object.__getattribute__(self, name)
-        except AttributeError:
-            pass
-        
-        enum_cls = object.__getattribute__(self, 'enum_cls')
-        if hasattr(enum_cls, name):
-            member = getattr(enum_cls, name)
-            if isinstance(member, _Enum):
-                # Retorna um novo controller com o valor do membro
-                return enum_cls(member)
-            return member
-        
-        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
-    
-    def __dir__(self):
-        '''Expõe membros do Enum para IntelliSense e autocomplete'''
-        base_attrs = set(super().__dir__())
-        enum_members = set(member.name for member in self.enum_cls)
-        return sorted(base_attrs | enum_members)
-
     @property
     def value(self):
         return self._value.value if self._value else None
@@ -174,15 +187,15 @@ class BaseEnumController(BaseEnum_Utils, OperationManager):
         if val is None:
             self._value = None
             return
-        if isinstance(val, self.enum_cls):
+        enum_cls = self.enum_cls
+        if isinstance(val, enum_cls):
             self._value = val
             return
-        if isinstance(val, str) and hasattr(self.enum_cls, val):
-            self._value = getattr(self.enum_cls, val)
-            return
-        for member in self.enum_cls:
-            if member.value == val:
-                self._value = member
-                return
-        raise ValueError(f'Valor "{val}" inválido')    
-        
\ No newline at end of file
+        member = None
+        if isinstance(val, str):
+            member = enum_cls.__name_index__.get(val)
+        if member is None:
+            member = enum_cls.__value_index__.get(val)
+        if member is None:
+            raise ValueError(f'Valor "{val}" inválido')
+        self._value = member
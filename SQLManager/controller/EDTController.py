@@ -1,42 +1,180 @@
+import functools
 import re
-from typing             import Any, Optional, Dict, Union, TypeAlias
+import string
+from datetime           import datetime, date, time
+from typing             import Any, Iterable, List, Optional, Dict, Union, TypeAlias
 from .SystemController  import SystemController
-from ..CoreConfig       import CoreConfig
+from ..CoreConfig       import CoreConfig, _compile_pattern
 from .operator import OperationManager
 
+# Tupla de tipos nativos de data montada uma vez: isinstance com tupla
+# literal reconstruiria a tupla a cada chamada de set_value/is_valid
+_DT_TYPES: tuple = (datetime, date, time)
+
+# Ids de regex que representam datas (consultado na construção do EDT)
+_DATE_REGEX_IDS: frozenset = frozenset({"date", "datetime"})
+
+# Padrões built-in compilados uma única vez no import; REGEX é construído a
+# cada EDT (inclusive por linha em loops de hidratação), então _set_type não
+# pode pagar dict novo + re.compile por chamada
+_BUILTIN_PATTERNS: Dict[str, re.Pattern] = {
+    regex_id: _compile_pattern(pattern)
+    for regex_id, pattern in {
+        "BigInt": r"\d+n",
+        "bool": r"[01]",
+        "any": r".*",
+        "binary": r"[01]+",
+        "cnpj_cpf": r"[0-9A-Z]{2}\.?[0-9A-Z]{3}\.?[0-9A-Z]{3}/?[0-9A-Z]{4}-?[0-9]{2}|[0-9]{3}\.?[0-9]{3}\.?[0-9]{3}-?[0-9]{2}",
+        "cnpj": r"[0-9A-Z]{2}\.?[0-9A-Z]{3}\.?[0-9A-Z]{3}/?[0-9A-Z]{4}-?[0-9]{2}",
+        "cpf": r"[0-9]{3}\.?[0-9]{3}\.?[0-9]{3}-?[0-9]{2}",
+        "cep": r"\d{5}-?\d{3}",
+        "date": r"[0-9]{2}[\\/-]?[0-9]{2}[\\/-]?[0-9]{4}",
+        "datetime": r"[0-9]{2}[\\/-]?[0-9]{2}[\\/-]?[0-9]{4}(?:\s+[0-9]{2}:[0-9]{2}(?::[0-9]{2})?)?",
+        "email": r"[\w.-]+@(?:[\w-]+\.)+[\w-]{2,4}",
+        "IP": r"(?:\d{1,3}\.){3}\d{1,3}|(?:[0-9a-fA-F]{0,4}:){2,7}[0-9a-fA-F]{0,4}",
+        "ipv4": r"(?:\d{1,3}\.){3}\d{1,3}",
+        "ipv6": r"(?:[0-9a-fA-F]{0,4}:){2,7}[0-9a-fA-F]{0,4}",
+        "number": r"(?:\(?\d{2}\)?\s?)?9?\d{4}-?\d{4}",
+        "onlyLetters": r"[a-zA-Z\s]+",
+        "onlyNumbers": r"[0-9]+",
+        "password": r"(?=.*[A-Za-z])(?=.*\d)[A-Za-z\d]{8,}",
+        "url": r"(?:https?://)?[\w.-]+\.[a-z]{2,}(?:[/\w.-]*)*/?",
+    }.items()
+}
+
+_LETTERS_WS = frozenset(string.ascii_letters + string.whitespace)
+
+# Separadores aceitos em CPF/CNPJ e o alfabeto do CNPJ alfanumérico
+_DOC_STRIP  = str.maketrans("", "", "./-")
+_CNPJ_CHARS = frozenset(string.digits + string.ascii_uppercase)
+
+def _cpf_fast(v: str) -> bool:
+    '''CPF: 11 dígitos após remover . e - (equivale ao padrão "cpf")'''
+    core = v.translate(_DOC_STRIP)
+    return len(core) == 11 and core.isascii() and core.isdigit()
+
+def _cep_fast(v: str) -> bool:
+    '''CEP: 12345-678 ou 12345678 (equivale ao padrão "cep")'''
+    if len(v) == 9:
+        return v[5] == "-" and v[:5].isdigit() and v[6:].isdigit() and v.isascii()
+    return len(v) == 8 and v.isascii() and v.isdigit()
+
+def _ipv4_fast(v: str) -> bool:
+    '''IPv4: 4 octetos de 1 a 3 dígitos (equivale ao padrão "ipv4")'''
+    parts = v.split(".")
+    if len(parts) != 4:
+        return False
+    for part in parts:
+        if not (0 < len(part) <= 3 and part.isascii() and part.isdigit()):
+            return False
+    return True
+
+def _cnpj_fast(v: str) -> bool:
+    '''CNPJ: 12 alfanuméricos + 2 dígitos após remover ./ e -'''
+    core = v.translate(_DOC_STRIP)
+    return (len(core) == 14 and core[12:].isdigit() and core[:12].isascii()
+            and not (set(core[:12]) - _CNPJ_CHARS))
+
+# Predicados em métodos de str para os ids mais simples: isdigit()/checagem
+# de conjunto custam uma fração do motor de regex e dispensam o cache de
+# resultados; equivalem aos padrões correspondentes de _BUILTIN_PATTERNS
+_FAST_VALIDATORS: Dict[str, Any] = {
+    "any": lambda v: True,
+    "bool": lambda v: v in ("0", "1"),
+    "binary": lambda v: bool(v) and not (set(v) - {"0", "1"}),
+    "onlyNumbers": lambda v: v.isascii() and v.isdigit(),
+    "onlyLetters": lambda v: bool(v) and not (set(v) - _LETTERS_WS),
+    "BigInt": lambda v: v.endswith("n") and v[:-1].isascii() and v[:-1].isdigit(),
+    "cep": _cep_fast,
+    "ipv4": _ipv4_fast,
+    "cpf": _cpf_fast,
+    "cnpj": _cnpj_fast,
+    "cnpj_cpf": lambda v: _cpf_fast(v) or _cnpj_fast(v),
+}
+
+# Tabelas de remoção de separadores de data/hora: um str.translate percorre a
+# string uma vez em C, contra três (ou uma) passadas de .replace encadeado
+_DATE_STRIP = str.maketrans("", "", "/-\\")
+_TIME_STRIP = str.maketrans("", "", ":")
+
+# Formato da hora por (len com ':', len sem ':'): HH:MM ou HH:MM:SS
+# O par de comprimentos barra formatos fora de posição (1:2:3 também
+# viraria 6 dígitos)
+_TIME_FORMATS = {(5, 4): "%H%M", (8, 6): "%H%M%S"}
+
 class EDT_Utils:
-    '''Classe utilitária para EDTs'''
+    '''
+    Classe utilitária para EDTs
+    is_valid e do_test são implementados em cada subclasse: a resolução de
+    atributo cai direto no método concreto, sem isinstance por chamada
+    '''
+    __slots__ = ()
+
     def do_test(self, regex_id: str, value: Any) -> bool:
         '''Valida um valor contra um regex_id'''
-        if(isinstance(self, EDTController)):
-            return self.regex.do_test(regex_id, value)
-        elif (isinstance(self, REGEX)):
-            return REGEX(regex_id).is_valid(value)
-        
+        raise NotImplementedError
+
     def is_valid(self, value: Any) -> bool:
         '''Verifica se o valor é válido para a instância'''
-        if(isinstance(self, EDTController)):
-            try:
-                self.set_value(value)
-                return True
-            except ValueError:
-                return False  
-        elif (isinstance(self, REGEX)):
-            if not self._regex_modes:
-                return False
-            return bool(self._regex_modes.fullmatch(str(value)))
-        
+        raise NotImplementedError
+
 class REGEX (EDT_Utils):
     """Classe REGEX para validações de formatações"""
+    # Instanciada por EDT: slots cortam o __dict__ por instância
+    __slots__ = ('regexId', '_regex_modes', '_match_cache')
+
     _regex_modes: Optional[re.Pattern]
 
+    # Flyweight por regex_id: instâncias são imutáveis após o __init__, então
+    # validações avulsas (do_test) compartilham a mesma instância e o mesmo
+    # cache de resultados em vez de construir um REGEX por chamada
+    _INSTANCES: Dict[str, "REGEX"] = {}
+
+    @classmethod
+    def get(cls, regex_id: str) -> "REGEX":
+        '''Retorna a instância compartilhada para o regex_id'''
+        instance = cls._INSTANCES.get(regex_id)
+        if instance is None:
+            instance = cls._INSTANCES[regex_id] = cls(regex_id)
+        return instance
+
     def __init__(self, regex_id: str):
         self.regexId      = regex_id
         self._regex_modes = self._set_type(regex_id)
+
+        # Ids simples usam o predicado de str direto (mais barato que o
+        # próprio hit no lru_cache), a menos que haja override customizado;
+        # para os demais, cache limitado de resultados: valores repetidos
+        # (status, códigos de país etc.) viram lookup em vez de motor de regex
+        fast = None if CoreConfig.has_regex(regex_id) else _FAST_VALIDATORS.get(regex_id)
+        if fast is not None:
+            self._match_cache = fast
+        elif self._regex_modes is not None:
+            self._match_cache = functools.lru_cache(maxsize=512)(self._regex_modes.fullmatch)
+        else:
+            self._match_cache = None
     
     def do_test(self, regex_id: str, value: Any) -> bool:
         '''Testa um valor contra um regex_id específico'''
-        return REGEX(regex_id).is_valid(value)
+        return REGEX.get(regex_id).is_valid(value)
+
+    def is_valid(self, value: Any) -> bool:
+        '''Verifica se o valor é válido para o padrão da instância'''
+        if self._match_cache is None:
+            return False
+        # type() is str evita a chamada str() (e a cópia) para o caso comum
+        return bool(self._match_cache(value if type(value) is str else str(value)))
+
+    def is_valid_batch(self, values: Iterable[Any]) -> List[bool]:
+        '''
+        Valida um iterável inteiro de uma vez
+        O matcher preso num local tira os lookups de atributo de dentro do
+        loop (ingestão em massa valida milhares de células por coluna)
+        '''
+        match = self._match_cache
+        if match is None:
+            return [False for _ in values]
+        return [bool(match(value if type(value) is str else str(value))) for value in values]
 
     def _set_type(self, regex_id: str) -> Optional[re.Pattern]:
         """
@@ -45,36 +183,20 @@ class REGEX (EDT_Utils):
         depois procura nos padrões built-in
         """
         if CoreConfig.has_regex(regex_id):
-            custom_pattern = CoreConfig.get_regex(regex_id)
-            return re.compile(custom_pattern) if custom_pattern else None
-        
-        patterns: Dict[str, str] = {
-            "BigInt": r"^\d+n$",
-            "bool": r"^[01]$",
-            "any": r"^.*$",
-            "binary": r"^(1|0)+$",
-            "cnpj_cpf": r"^([0-9A-Z]{2}[\.]?[0-9A-Z]{3}[\.]?[0-9A-Z]{3}[\/]?[0-9A-Z]{4}[-]?[0-9]{2})$|^([0-9]{3}[\.]?[0-9]{3}[\.]?[0-9]{3}[-]?[0-9]{2})$",
-            "cnpj": r"^([0-9A-Z]{2}[\.]?[0-9A-Z]{3}[\.]?[0-9A-Z]{3}[\/]?[0-9A-Z]{4}[-]?[0-9]{2})$",
-            "cpf": r"^([0-9]{3}[\.]?[0-9]{3}[\.]?[0-9]{3}[-]?[0-9]{2})$",
-            "cep": r"^\d{5}-?\d{3}$",
-            "date": r"^[0-9]{2}[\\\/\-]?[0-9]{2}[\\\/\-]?[0-9]{4}$",
-            "datetime": r"^[0-9]{2}[\\\/\-]?[0-9]{2}[\\\/\-]?[0-9]{4}(\s+[0-9]{2}:[0-9]{2}(:[0-9]{2})?)?$",
-            "email": r"^[\w\.-]+@([\w-]+\.)+[\w-]{2,4}$",
-            "IP": r"^(\d{1,3}\.){3}\d{1,3}$|^([0-9a-fA-F]{0,4}:){2,7}[0-9a-fA-F]{0,4}$",
-            "ipv4": r"^(\d{1,3}\.){3}\d{1,3}$",
-            "ipv6": r"^([0-9a-fA-F]{0,4}:){2,7}[0-9a-fA-F]{0,4}$",
-            "number": r"^(?:\(?\d{2}\)?\s?)?9?\d{4}-?\d{4}$",
-            "onlyLetters": r"^[a-zA-Z\s]+$",
-            "onlyNumbers": r"^[0-9]+$",
-            "password": r"^(?=.*[A-Za-z])(?=.*\d)[A-Za-z\d]{8,}$",
-            "url": r"^(https?:\/\/)?([\w.-]+)\.([a-z]{2,})([\/\w.-]*)*\/?$",
-        }
-        
-        pattern = patterns.get(regex_id)
-        return re.compile(pattern) if pattern else None    
+            return CoreConfig.get_compiled_regex(regex_id)
+
+        return _BUILTIN_PATTERNS.get(regex_id)
 
 class EDTController(EDT_Utils, OperationManager):
     '''Classe de controle padrão de EDTs'''
+    # _field_name é injetado pelo TableController.__setattr__
+    __slots__ = ('regex', 'type_id', '_value', 'limit', '_expected_type',
+                 '_expected_type_default', '_regex_match', '_is_date_regex',
+                 '_int_regex_id', '_field_name')
+
+    # Valor padrão por tipo esperado, resolvido uma vez no __init__
+    _TYPE_DEFAULTS = {int: 0, float: 0.0, str: "", bool: False}
+
     _value: Any
     regex: REGEX
     type_id: Optional[type]
@@ -86,6 +208,15 @@ class EDTController(EDT_Utils, OperationManager):
         self._value  = None
         self.limit   = limit
 
+        # Validadores resolvidos uma única vez: set_value vira chamadas
+        # diretas, sem hasattr/isinstance de descoberta por chamada
+        expected = type_id.value if hasattr(type_id, 'value') else type_id
+        self._expected_type = expected if isinstance(expected, type) else None
+        self._expected_type_default = self._TYPE_DEFAULTS.get(expected) if isinstance(expected, type) else None
+        self._regex_match   = self.regex._match_cache
+        self._is_date_regex = regextype in _DATE_REGEX_IDS
+        self._int_regex_id  = regextype if regextype in ("onlyNumbers", "bool") else None
+
         if edt_value is not None:
             self._value = self.set_value(edt_value, limit)
 
@@ -110,27 +241,44 @@ class EDTController(EDT_Utils, OperationManager):
     @property
     def value(self) -> Any:
         """Retorna o valor ou valor padrão do tipo se None"""
-        if self._value is not None:
-            return self._value
-        
-        # Se não há valor, retorna padrão baseado no type_id
-        if self.type_id is not None:
-            expected_type = self.type_id.value if hasattr(self.type_id, 'value') else self.type_id
-            if expected_type == int:
-                return 0
-            elif expected_type == float:
-                return 0.0
-            elif expected_type == str:
-                return ""
-            elif expected_type == bool:
-                return False
-        
-        return None
+        value = self._value
+        return value if value is not None else self._expected_type_default
 
     @value.setter
     def value(self, val: Any):
         self._value = self.set_value(val)
 
+    def do_test(self, regex_id: str, value: Any) -> bool:
+        '''Valida um valor contra um regex_id'''
+        return self.regex.do_test(regex_id, value)
+
+    def is_valid(self, value: Any) -> bool:
+        '''
+        Verifica se o valor é válido para o EDT
+        Pré-checagens baratas: valor inválido sai por booleano, sem montar
+        as strings coloridas de erro do set_value só para capturar o
+        ValueError em seguida
+        '''
+        if value is None or value == "":
+            return True
+        expected_type = self._expected_type
+        if expected_type is not None and not isinstance(value, expected_type):
+            return False
+        if not isinstance(value, _DT_TYPES):
+            if self._is_date_regex and isinstance(value, str):
+                # set_value valida datas via strptime; aqui o ValueError
+                # vira booleano
+                try:
+                    self.set_value(value)
+                except ValueError:
+                    return False
+                return True
+            regex_match = self._regex_match
+            if regex_match is None or not regex_match(value if type(value) is str else str(value)):
+                return False
+        self.set_value(value)
+        return True
+
     @staticmethod
     def any_type() -> Any:
         return Any
@@ -140,85 +288,89 @@ class EDTController(EDT_Utils, OperationManager):
         return cls("plaintxt")  # ou outro valor padrão
 
     def set_value(self, edt_value: Any, limit: Optional[int] = None) -> Any:
-        from datetime import datetime, date, time
-        
         if edt_value is None or edt_value == "":
-            return edt_value                                
-        
-        # Valida tipo se definido
-        if self.type_id is not None:
-            expected_type = self.type_id.value if hasattr(self.type_id, 'value') else self.type_id
-            if isinstance(expected_type, type):
-                if not isinstance(edt_value, expected_type):
-                    raise ValueError(
-                        f"\nValor {SystemController.custom_text(edt_value, 'blue')} "
-                        f"deve ser do tipo {SystemController.custom_text(expected_type.__name__, 'red', False, True)} "
-                        f"e atualmente é {SystemController.custom_text(type(edt_value).__name__, 'red', False, True)}\n"
-                    )
-        
-        # Pula validação de regex para tipos nativos datetime/date/time do Python
-        skip_regex_validation = isinstance(edt_value, (datetime, date, time))
-        
-        # Valida regex apenas se não for um tipo datetime nativo
-        if not skip_regex_validation and not self.regex.is_valid(edt_value):
+            return edt_value
+
+        # Valida tipo se definido (resolvido uma vez no __init__)
+        expected_type = self._expected_type
+        if expected_type is not None and not isinstance(edt_value, expected_type):
             raise ValueError(
                 f"\nValor {SystemController.custom_text(edt_value, 'blue')} "
-                f"não corresponde ao formato esperado.\nFormato esperado: "
-                f"{SystemController.custom_text(self.regex.regexId, 'red', False, True)}\n"
+                f"deve ser do tipo {SystemController.custom_text(expected_type.__name__, 'red', False, True)} "
+                f"e atualmente é {SystemController.custom_text(type(edt_value).__name__, 'red', False, True)}\n"
             )
-        
-        # Converte string para datetime/date se o regex for de data
-        if isinstance(edt_value, str) and not skip_regex_validation:
-            edt_value = self._convert_to_datetime(edt_value)
-        
-        # Valida limite se definido
-        if limit is not None and len(str(edt_value)) > limit:
+
+        # Pula validação de regex para tipos nativos datetime/date/time do Python
+        if not isinstance(edt_value, _DT_TYPES):
+            if self._int_regex_id is not None and type(edt_value) is int:
+                # int já tipado valida por comparação: str(int) não-negativo
+                # casa com onlyNumbers por construção (e 0/1 com bool), sem
+                # stringificar o valor
+                if not (edt_value >= 0 if self._int_regex_id == "onlyNumbers" else 0 <= edt_value <= 1):
+                    raise self._format_error(edt_value)
+            elif self._is_date_regex and isinstance(edt_value, str):
+                # Validação e conversão fundidas: o strptime rejeita tudo que
+                # o regex de data rejeitaria, numa única passada pela string
+                try:
+                    edt_value = self._convert_to_datetime(edt_value)
+                except ValueError:
+                    raise self._format_error(edt_value)
+            else:
+                regex_match = self._regex_match
+                if regex_match is None or not regex_match(edt_value if type(edt_value) is str else str(edt_value)):
+                    raise self._format_error(edt_value)
+
+        # Valida limite se definido (strings já têm len, sem re-stringificar)
+        if limit is not None and (len(edt_value) if isinstance(edt_value, str) else len(str(edt_value))) > limit:
             raise ValueError(
                 f"\nValor {SystemController.custom_text(edt_value, 'blue')} "
                 f"excede o limite de {SystemController.custom_text(limit, 'red', False, True)} caracteres\n"
             )
-        
+
         self._value = edt_value
-        return edt_value          
-
-    def _convert_to_datetime(self, value: str) -> Any:
-        """Converte string para datetime/date se o regex_id for relacionado a datas"""
-        from datetime import datetime
-        
-        # Se não for um regex de data, retorna o valor original
-        if self.regex.regexId not in ["date", "datetime"]:
-            return value
-        
-        # Remove separadores comuns
-        cleaned = value.replace("/", "").replace("-", "").replace("\\", "")
-        
-        try:
-            if self.regex.regexId == "datetime":
-                # Tenta parsear datetime com hora
-                if " " in value:
-                    # Com hora
-                    date_part, time_part = value.split(None, 1)
-                    date_cleaned = date_part.replace("/", "").replace("-", "").replace("\\", "")
-                    time_cleaned = time_part.replace(":", "")
-                    
-                    # Formatos: ddmmyyyy HHMM ou ddmmyyyy HHMMSS
-                    if len(time_cleaned) == 4:
-                        return datetime.strptime(date_cleaned + time_cleaned, "%d%m%Y%H%M")
-                    elif len(time_cleaned) == 6:
-                        return datetime.strptime(date_cleaned + time_cleaned, "%d%m%Y%H%M%S")
-                else:
-                    # Sem hora, apenas data
-                    return datetime.strptime(cleaned, "%d%m%Y")
-            
-            elif self.regex.regexId == "date":
-                # Apenas data (dd/mm/yyyy ou ddmmyyyy)
-                return datetime.strptime(cleaned, "%d%m%Y").date()
-        
-        except ValueError:
-            # Se falhar a conversão, retorna o valor original como string
-            pass
-        
-        return value
+        return edt_value
+
+    def _format_error(self, edt_value: Any) -> ValueError:
+        '''Monta o ValueError padrão de formato inválido'''
+        return ValueError(
+            f"\nValor {SystemController.custom_text(edt_value, 'blue')} "
+            f"não corresponde ao formato esperado.\nFormato esperado: "
+            f"{SystemController.custom_text(self.regex.regexId, 'red', False, True)}\n"
+        )
+
+    def _convert_to_datetime(self, value: str) -> Union[datetime, date]:
+        """
+        Valida e converte string de data em uma única passada
+        O strptime faz o papel do regex: formato inválido levanta ValueError
+        (o set_value traduz para a mensagem de formato esperado)
+        """
+        if self.regex.regexId == "datetime" and " " in value:
+            # Com hora: dd/mm/yyyy HH:MM ou dd/mm/yyyy HH:MM:SS
+            value, time_part = value.split(None, 1)
+            time_cleaned = time_part.translate(_TIME_STRIP)
+            time_format = _TIME_FORMATS.get((len(time_part), len(time_cleaned)))
+            if time_format is None:
+                raise ValueError(f"hora inválida: {time_part!r}")
+            cleaned = value.translate(_DATE_STRIP)
+            if len(cleaned) != 8:
+                raise ValueError(f"data inválida: {value!r}")
+            return datetime.strptime(cleaned + time_cleaned, "%d%m%Y" + time_format)
+
+        # Apenas data (dd/mm/yyyy ou ddmmyyyy)
+        cleaned = value.translate(_DATE_STRIP)
+        if len(cleaned) != 8:
+            raise ValueError(f"data inválida: {value!r}")
+        parsed = datetime.strptime(cleaned, "%d%m%Y")
+        return parsed if self.regex.regexId == "datetime" else parsed.date()
+
+    def set_values(self, values: Iterable[Any]) -> List[Any]:
+        '''
+        Aplica set_value a cada item do iterável e retorna os valores
+        convertidos (o último item fica como valor do EDT); o bound method
+        num local evita o lookup por iteração
+        '''
+        set_value = self.set_value
+        return [set_value(value) for value in values]
 
     def value_of(self) -> Any:
         return self._value
@@ -1,11 +1,7 @@
 from typing              import Any, List, Dict, Optional, Union, Callable
 from functools           import wraps
 import weakref
-import inspect
-import sys
 
-from concurrent.futures  import ThreadPoolExecutor, as_completed
-from threading           import Lock
 from ..connection        import database_connection as data, Transaction
 from .EDTController      import EDTController
 from .BaseEnumController import BaseEnumController
@@ -62,6 +58,25 @@ class FieldCondition:
         sql = f"{prefix}{self.field_name} {self.operator} ?"
         return (sql, self.value)
 
+    def _emit(self, sql_parts: list, values: list):
+        '''Acumula o SQL e os valores nas listas compartilhadas da árvore'''
+        prefix = f"{self.table_alias}." if self.table_alias else ""
+        sql_parts.append(f"{prefix}{self.field_name} {self.operator} ?")
+        value = self.value
+        if isinstance(value, list):
+            values.extend(value)
+        else:
+            values.append(value)
+
+    def structure_key(self) -> tuple:
+        '''Assinatura estrutural da condição (sem os valores), para cache de query'''
+        return (self.table_alias, self.field_name, self.operator)
+
+    def bind_values(self) -> list:
+        '''Somente os valores de bind, na mesma ordem do SQL gerado'''
+        value = self.value
+        return value if isinstance(value, list) else [value]
+
 class BinaryExpression:
     '''Representa uma expressão binária entre condições'''
     def __init__(self, left: Union[FieldCondition, 'BinaryExpression'], 
@@ -78,17 +93,31 @@ class BinaryExpression:
         return BinaryExpression(self, 'OR', other)
     
     def to_sql(self) -> tuple:
-        '''Converte a expressão para SQL recursivamente'''
-        left_sql, left_val = self.left.to_sql()
-        right_sql, right_val = self.right.to_sql()
-        
-        left_values = left_val if isinstance(left_val, list) else [left_val]
-        right_values = right_val if isinstance(right_val, list) else [right_val]
-        
-        sql = f"({left_sql} {self.operator} {right_sql})"
-        values = left_values + right_values
-        
-        return (sql, values)
+        '''
+        Converte a expressão para SQL com um único join final: cada nó só
+        anexa seus fragmentos às listas compartilhadas, sem concatenar
+        strings intermediárias a cada nível da árvore
+        '''
+        sql_parts: list = []
+        values: list = []
+        self._emit(sql_parts, values)
+        return (''.join(sql_parts), values)
+
+    def _emit(self, sql_parts: list, values: list):
+        '''Acumula o SQL e os valores nas listas compartilhadas da árvore'''
+        sql_parts.append('(')
+        self.left._emit(sql_parts, values)
+        sql_parts.append(f" {self.operator} ")
+        self.right._emit(sql_parts, values)
+        sql_parts.append(')')
+
+    def structure_key(self) -> tuple:
+        '''Assinatura estrutural recursiva da expressão (sem os valores)'''
+        return (self.left.structure_key(), self.operator, self.right.structure_key())
+
+    def bind_values(self) -> list:
+        '''Valores de bind da árvore inteira, na ordem do SQL gerado'''
+        return self.left.bind_values() + self.right.bind_values()
 
 class AutoExecuteWrapper:
     '''Wrapper que delega métodos para SelectManager mas auto-executa quando não há mais encadeamento'''
@@ -181,7 +210,13 @@ class AutoExecuteWrapper:
 
 class SelectManager:
     '''Gerencia operações SELECT com API fluente - Auto-executa quando a cadeia termina'''
-    
+
+    # Cache de templates de SELECT por assinatura estrutural: queries repetidas
+    # (mesma tabela/colunas/joins/forma do WHERE) pulam toda a montagem de
+    # string e a validação de colunas, trocando apenas os valores de bind
+    _SELECT_CACHE: Dict[tuple, tuple] = {}
+    _SELECT_CACHE_MAX = 512
+
     def __init__(self, table_controller):
         self._controller = table_controller
         self._where_conditions: Optional[Union[FieldCondition, BinaryExpression]] = None
@@ -193,6 +228,7 @@ class SelectManager:
         self._group_by: Optional[List[str]] = None
         self._having_conditions: Optional[List[Dict[str, Any]]] = None
         self._distinct: bool = False
+        self._columnar: bool = False
         self._do_update: bool = True
         self._executed = False
         self._last_results = []        
@@ -210,33 +246,34 @@ class SelectManager:
         self._executed = False
         return self
 
-    def _should_auto_execute(self):
-        """Verifica se deve executar automaticamente baseado no contexto de chamada"""
-        try:
-            frame = sys._getframe(2)  
-            import dis
-            code = frame.f_code
-            return True
-        except:
-            return True
+    def _ensure_results(self) -> List[Any]:
+        '''
+        Executa a query no máximo uma vez e devolve os resultados
+        materializados: iterar e depois chamar len()/indexação reaproveita
+        a mesma execução em vez de repetir o SQL
+        '''
+        if not self._executed:
+            self.execute()
+        return self._last_results
 
     def __iter__(self):
         """Permite iterar sobre os resultados"""
-        return iter(self.execute())
-    
+        return iter(self._ensure_results())
+
     def __len__(self):
         """Retorna o total de resultados"""
-        return len(self.execute())
-    
+        return len(self._ensure_results())
+
     def __getitem__(self, index):
         """Permite acesso por índice"""
-        return self.execute()[index]
+        return self._ensure_results()[index]
 
     def where(self, condition: Union[FieldCondition, BinaryExpression]) -> 'SelectManager':
         '''Adiciona condições WHERE e permite encadeamento'''
         self._where_conditions = condition
+        self._executed = False
         return self
-    
+
     def columns(self, *cols: Union[str, EDTController, 'BaseEnumController']) -> 'SelectManager':
         '''Define as colunas a serem retornadas - Aceita campos EDT/Enum ou strings'''
         extracted_cols = []
@@ -246,6 +283,7 @@ class SelectManager:
             else:
                 extracted_cols.append(str(col))
         self._columns = extracted_cols
+        self._executed = False
         return self
     
     def join(self, other_table, join_type: str = 'INNER') -> 'JoinBuilder':
@@ -255,36 +293,54 @@ class SelectManager:
     def order_by(self, column: Union[str, EDTController, 'BaseEnumController']) -> 'SelectManager':
         '''Define ordenação - Aceita campo ou string'''
         self._order_by = self._extract_field_name(column)
+        self._executed = False
         return self
-    
+
     def limit(self, count: int) -> 'SelectManager':
         '''Define limite de registros'''
         self._limit = count
+        self._executed = False
         return self
-    
+
     def offset(self, count: int) -> 'SelectManager':
         '''Define offset'''
         self._offset = count
+        self._executed = False
         return self
-    
+
     def group_by(self, *columns: Union[str, EDTController, 'BaseEnumController']) -> 'SelectManager':
         '''Define GROUP BY - Aceita campos ou strings'''
         self._group_by = [self._extract_field_name(col) for col in columns]
+        self._executed = False
         return self
-    
+
     def having(self, conditions: List[Dict[str, Any]]) -> 'SelectManager':
         '''Define HAVING para usar com GROUP BY'''
         self._having_conditions = conditions
+        self._executed = False
         return self
-    
+
     def distinct(self) -> 'SelectManager':
         '''Adiciona DISTINCT'''
         self._distinct = True
+        self._executed = False
         return self
-    
+
+    def as_columnar(self) -> 'SelectManager':
+        '''
+        Retorna o resultado em layout colunar: um único dict
+        {coluna: tupla de valores} em vez de um dict por linha
+        (O(K) alocações em vez de O(N*K); só para selects simples, sem
+        JOIN/agregação, e não hidrata a instância)
+        '''
+        self._columnar = True
+        self._executed = False
+        return self
+
     def do_update(self, update: bool = True) -> 'SelectManager':
         '''Define se deve atualizar a instância com o resultado'''
         self._do_update = update
+        self._executed = False
         return self
     
     def execute(self):
@@ -300,78 +356,109 @@ class SelectManager:
         columns = self._columns or ['*']
         limit = self._limit or 100
         offset = self._offset or 0
-        
+
         table_columns = self._controller.get_table_columns()
-        has_aggregates = any(self._controller._is_aggregate_function(col) for col in columns) if columns != ['*'] else False
-        
-        if columns != ['*']:
-            col_names = [col[0] for col in table_columns]
-            for col in columns:
-                if self._controller._is_aggregate_function(col):
-                    field_name = self._controller._extract_field_from_aggregate(col)
-                    if field_name and field_name not in col_names:
-                        raise Exception(f"Campo '{field_name}' na agregação '{col}' não existe na tabela")
-                elif col not in col_names:
-                    raise Exception(f"Coluna inválida: {col}")
-        
-        main_alias = self._controller.table_name
-        select_columns = []
-        
-        if columns == ['*']:
-            select_columns += [f"{main_alias}.{col[0]} AS {main_alias}_{col[0]}" for col in table_columns]
+        join_controllers = [(join['controller'], join['alias']) for join in self._joins]
+
+        # Fingerprint estrutural: tudo que influencia o texto da query, exceto
+        # os valores de bind (o WHERE entra pela forma da árvore de condições)
+        cache_key = (
+            self._controller.table_name,
+            tuple(columns),
+            tuple((join['type'], join['controller'].table_name, join['on'],
+                   join['alias'], join.get('index_hint'),
+                   tuple(join['columns']) if join['columns'] else None)
+                  for join in self._joins),
+            self._order_by, limit, offset,
+            tuple(self._group_by) if self._group_by is not None else None,
+            tuple((h['field'], h.get('operator', '=')) for h in self._having_conditions)
+                if self._having_conditions is not None else None,
+            self._distinct,
+            self._where_conditions.structure_key() if self._where_conditions is not None else None,
+        )
+
+        cached = SelectManager._SELECT_CACHE.get(cache_key)
+        if cached is not None:
+            query, has_aggregates = cached
         else:
-            for col in columns:
-                if self._controller._is_aggregate_function(col):
-                    alias_name = col.replace('(', '_').replace(')', '').replace('*', 'ALL').replace('.', '_').replace(' ', '')
-                    select_columns.append(f"{col} AS {alias_name}")
-                else:
-                    select_columns.append(f"{main_alias}.{col} AS {main_alias}_{col}")
-        
-        join_clauses = []
-        join_controllers = []
-        for join in self._joins:
-            ctrl = join['controller']
-            alias = join['alias']
-            join_type = join['type']
-            join_on = join['on']
-            index_hint = join.get('index_hint')
-            
-            join_columns = ctrl.get_table_columns()
-            join_controllers.append((ctrl, alias))
-            
-            if join['columns']:
-                select_columns += [f"{alias}.{col} AS {alias}_{col}" for col in join['columns']]
+            # Classifica cada coluna uma única vez: as checagens de agregação
+            # eram refeitas em três passadas distintas sobre a mesma lista
+            is_agg = self._controller._is_aggregate_function
+            agg_flags = [is_agg(col) for col in columns] if columns != ['*'] else []
+            has_aggregates = any(agg_flags)
+
+            if columns != ['*']:
+                col_names = self._controller._get_column_name_set()
+                for col, col_is_agg in zip(columns, agg_flags):
+                    if col_is_agg:
+                        field_name = self._controller._extract_field_from_aggregate(col)
+                        if field_name and field_name not in col_names:
+                            raise Exception(f"Campo '{field_name}' na agregação '{col}' não existe na tabela")
+                    elif col not in col_names:
+                        raise Exception(f"Coluna inválida: {col}")
+
+            main_alias = self._controller.table_name
+            select_columns = []
+
+            if columns == ['*']:
+                select_columns += [f"{main_alias}.{col[0]} AS {main_alias}_{col[0]}" for col in table_columns]
             else:
-                select_columns += [f"{alias}.{col[0]} AS {alias}_{col[0]}" for col in join_columns]
-            
-            hint = f" WITH (INDEX({index_hint}))" if index_hint else ""
-            join_clauses.append(f" {join_type} JOIN {ctrl.table_name} AS {alias}{hint} ON {join_on} ")
-        
-        distinct_keyword = "DISTINCT " if self._distinct else ""
-        query = f"SELECT {distinct_keyword}{', '.join(select_columns)} FROM {self._controller.table_name} AS {main_alias}" + ''.join(join_clauses)
+                for col, col_is_agg in zip(columns, agg_flags):
+                    if col_is_agg:
+                        alias_name = col.replace('(', '_').replace(')', '').replace('*', 'ALL').replace('.', '_').replace(' ', '')
+                        select_columns.append(f"{col} AS {alias_name}")
+                    else:
+                        select_columns.append(f"{main_alias}.{col} AS {main_alias}_{col}")
+
+            join_clauses = []
+            for join in self._joins:
+                ctrl = join['controller']
+                alias = join['alias']
+                join_type = join['type']
+                join_on = join['on']
+                index_hint = join.get('index_hint')
+
+                if join['columns']:
+                    select_columns += [f"{alias}.{col} AS {alias}_{col}" for col in join['columns']]
+                else:
+                    select_columns += [f"{alias}.{col[0]} AS {alias}_{col[0]}" for col in ctrl.get_table_columns()]
+
+                hint = f" WITH (INDEX({index_hint}))" if index_hint else ""
+                join_clauses.append(f" {join_type} JOIN {ctrl.table_name} AS {alias}{hint} ON {join_on} ")
+
+            distinct_keyword = "DISTINCT " if self._distinct else ""
+            query = f"SELECT {distinct_keyword}{', '.join(select_columns)} FROM {self._controller.table_name} AS {main_alias}" + ''.join(join_clauses)
+
+            if self._where_conditions is not None:
+                where_sql, _ = self._where_conditions.to_sql()
+                query += f" WHERE {where_sql}"
+
+            if self._group_by is not None:
+                group_clauses = [f"{main_alias}.{field}" for field in self._group_by]
+                query += " GROUP BY " + ", ".join(group_clauses)
+
+            if self._having_conditions is not None:
+                having_clauses = []
+                for h in self._having_conditions:
+                    operator = h.get('operator', '=')
+                    having_clauses.append(f"{h['field']} {operator} ?")
+                query += " HAVING " + " AND ".join(having_clauses)
+
+            if self._order_by is not None:
+                query += f" ORDER BY {main_alias}.{self._order_by}"
+                query += f" OFFSET {offset} ROWS FETCH NEXT {limit} ROWS ONLY"
+
+            if len(SelectManager._SELECT_CACHE) >= SelectManager._SELECT_CACHE_MAX:
+                SelectManager._SELECT_CACHE.clear()
+            SelectManager._SELECT_CACHE[cache_key] = (query, has_aggregates)
+
+        # Valores de bind extraídos por execução (o template é fixo)
         values = []
-        
-        if self._where_conditions or self.where_conditions is not None:
-            where_sql, where_values = self._where_conditions.to_sql()
-            query += f" WHERE {where_sql}"
-            values.extend(where_values if isinstance(where_values, list) else [where_values])
-        
-        if self._group_by or self._group_by is not None:
-            group_clauses = [f"{main_alias}.{field}" for field in self._group_by]
-            query += " GROUP BY " + ", ".join(group_clauses)
-        
-        if self._having_conditions or self._having_conditions is not None:
-            having_clauses = []
-            for h in self._having_conditions:
-                operator = h.get('operator', '=')
-                having_clauses.append(f"{h['field']} {operator} ?")
-                values.append(h['value'])
-            query += " HAVING " + " AND ".join(having_clauses)
-        
-        if self._order_by or self._order_by is not None:
-            query += f" ORDER BY {main_alias}.{self._order_by}"
-            query += f" OFFSET {offset} ROWS FETCH NEXT {limit} ROWS ONLY"
-        
+        if self._where_conditions is not None:
+            values.extend(self._where_conditions.bind_values())
+        if self._having_conditions is not None:
+            values.extend(h['value'] for h in self._having_conditions)
+
         # Executa a query usando o método apropriado do banco
         if hasattr(self._controller.db, 'doQuery'):
             rows = self._controller.db.doQuery(query, tuple(values))
@@ -381,7 +468,7 @@ class SelectManager:
             rows = result.fetchall() if hasattr(result, 'fetchall') else result
         elif hasattr(self._controller.db, 'executeCommand'):
             cursor = self._controller.db.executeCommand(query, tuple(values))
-            rows = cursor.fetchall() if cursor else []
+            rows = cursor.fetchall() if hasattr(cursor, 'fetchall') else []
         else:
             raise Exception(f"Objeto de conexão não possui método compatível (doQuery, execute ou executeCommand)")
         
@@ -389,13 +476,18 @@ class SelectManager:
             results = self._process_aggregate_results(rows, columns, table_columns)
         elif self._joins:
             results = self._process_join_results(rows, table_columns, join_controllers)
+        elif self._columnar:
+            results = self._process_simple_results_soa(rows, table_columns)
         else:
             results = self._process_simple_results(rows, table_columns)
-        
+
         # SEMPRE armazena results no SelectManager para que exists() possa acessar
         self._last_results = results
-        
-        if self._do_update:
+
+        if self._columnar:
+            # Layout colunar é para consumo direto; não hidrata a instância
+            self._controller.records = results
+        elif self._do_update:
             if results:
                 if self._joins:
                     self._controller.records = [r[0] for r in results] if results and isinstance(results[0], list) else results
@@ -467,36 +559,47 @@ class SelectManager:
     
     def _process_join_results(self, rows, table_columns, join_controllers):
         """Processa resultados com JOINs"""
+        # Plano de fatias montado uma vez: as fronteiras de cada controller
+        # na linha são fixas, então cada linha vira zip + slice em vez de
+        # avançar um índice coluna a coluna
+        main_keys = tuple(col[0] for col in table_columns)
+        main_stop = len(main_keys)
+
+        join_plans = []
+        start = main_stop
+        for ctrl, alias in join_controllers:
+            keys = tuple(col[0] for col in ctrl.get_table_columns())
+            stop = start + len(keys)
+            join_plans.append((keys, ctrl, start, stop))
+            start = stop
+
         results = []
         for row in rows:
-            idx = 0
-            main_data = {}
-            for col in table_columns:
-                main_data[col[0]] = row[idx]
-                idx += 1
-            
             main_instance = self._controller.__class__(self._controller.db)
-            main_instance.set_current(main_data)
-            join_instances = []
-            
-            for ctrl, alias in join_controllers:
-                join_cols = ctrl.get_table_columns()
-                join_data = {}
-                for col in join_cols:
-                    join_data[col[0]] = row[idx]
-                    idx += 1
+            main_instance.set_current(dict(zip(main_keys, row)))
+            record = [main_instance]
+
+            for keys, ctrl, lo, hi in join_plans:
                 join_instance = ctrl.__class__(ctrl.db)
-                join_instance.set_current(join_data)
-                join_instances.append(join_instance)
-            
-            results.append([main_instance] + join_instances)
-        
+                join_instance.set_current(dict(zip(keys, row[lo:hi])))
+                record.append(join_instance)
+
+            results.append(record)
+
         return results
     
     def _process_simple_results(self, rows, table_columns):
         """Processa resultados simples sem JOINs"""
-        result = [dict(zip([col[0] for col in table_columns], row)) for row in rows]
-        return result
+        # Tupla de chaves montada uma vez, fora da comprehension por linha
+        keys = tuple(col[0] for col in table_columns)
+        return [dict(zip(keys, row)) for row in rows]
+
+    def _process_simple_results_soa(self, rows, table_columns):
+        """Processa resultados simples em layout colunar (dict de tuplas)"""
+        keys = tuple(col[0] for col in table_columns)
+        if not rows:
+            return {key: () for key in keys}
+        return dict(zip(keys, zip(*rows)))
 
     def records(self) -> List[Any]:
         """Retorna os registros obtidos (após execução)"""
@@ -532,7 +635,8 @@ class JoinBuilder:
             'alias': other_alias,
             'index_hint': index_hint
         })
-        
+        self.select_manager._executed = False
+
         return self.select_manager
 
 class InsertRecordsetWrapper:
@@ -670,9 +774,8 @@ class InsertRecordsetManager:
         if not self._columns or not self._source_data:
             raise Exception("Colunas e dados são obrigatórios para insert_recordset")
         
-        table_columns = self._controller.get_table_columns()
-        col_names = [col[0] for col in table_columns]
-        
+        col_names = self._controller._get_column_name_set()
+
         for col in self._columns:
             if col.upper() not in col_names:
                 raise Exception(f"Campo '{col}' não existe na tabela {self._controller.table_name}")
@@ -715,7 +818,7 @@ class InsertRecordsetManager:
         """Insere apenas registros que NÃO existem usando estratégia otimizada em lotes"""
         key_idx = [col.upper() for col in self._columns].index(self._key_column)
         input_keys = [row[key_idx] for row in self._source_data]
-        batch_size = 5000  # Aumente conforme o banco suportar
+        batch_size = 2000  # SQL Server aceita no máximo ~2100 parâmetros por comando
         existing_keys = set()
         for i in range(0, len(input_keys), batch_size):
             batch_keys = input_keys[i:i + batch_size]
@@ -757,7 +860,13 @@ class InsertManager:
     """
     Gerencia operações INSERT com validação automática
     """
-    
+
+    # Cache do texto do INSERT por (tabela, tupla de campos): com schema fixo
+    # a combinação se repete e os joins de colunas/placeholders saem do caminho
+    _INSERT_CACHE: Dict[tuple, str] = {}
+    _INSERT_CACHE_MAX = 256
+
+
     @staticmethod
     def validate_insert(func: Callable) -> Callable:
         '''Decorator para validar operações de INSERT'''
@@ -787,11 +896,10 @@ class InsertManager:
         fields = []
         values = []
         
-        for key in controller.__dict__:
-            attr = controller._get_field_instance(key)
-            if not (isinstance(attr, (EDTController, BaseEnumController, BaseEnumController.Enum))) or key == 'RECID':
+        for key, attr in controller._field_items():
+            if key == 'RECID':
                 continue
-            
+
             # Pular campos com DEFAULT que estão None (permite DB aplicar default)
             if key in columns_with_default and attr.value is None:
                 continue
@@ -802,8 +910,14 @@ class InsertManager:
         if not fields:
             raise Exception("Nenhum campo para inserir")
         
-        query = f"INSERT INTO {controller.table_name} (" + ", ".join(fields) + ") OUTPUT INSERTED.RECID VALUES (" + ", ".join(['?'] * len(fields)) + ")"
-        
+        cache_key = (controller.table_name, tuple(fields))
+        query = InsertManager._INSERT_CACHE.get(cache_key)
+        if query is None:
+            query = f"INSERT INTO {controller.table_name} (" + ", ".join(fields) + ") OUTPUT INSERTED.RECID VALUES (" + ", ".join(['?'] * len(fields)) + ")"
+            if len(InsertManager._INSERT_CACHE) >= InsertManager._INSERT_CACHE_MAX:
+                InsertManager._INSERT_CACHE.clear()
+            InsertManager._INSERT_CACHE[cache_key] = query
+
         try:
             controller.db.ttsbegin()
             result = controller.db.doQuery(query, tuple(values))
@@ -848,11 +962,9 @@ class UpdateManager:
             
             if not hasattr(self, 'RECID') or self._get_field_instance('RECID').value is None:
                 raise Exception("Atualização sem chave primaria, preencha o campo RECID")
-            
-            recid_instance = self._get_field_instance('RECID')
-            if not self._check_exists(recid_instance == recid_instance.value):
-                raise Exception(f"Registro com RECID {recid_instance.value} não existe na tabela {self.table_name}")
-            
+
+            # A existência do RECID é verificada pelo próprio UPDATE (linha
+            # retornada pelo OUTPUT), sem SELECT prévio de ida e volta
             return func(self, *args, **kwargs)
         return wrapper
     
@@ -869,12 +981,10 @@ class UpdateManager:
         values      = []
         set_clauses = []
         
-        for key in controller.__dict__:
-            attr = controller._get_field_instance(key)
-
-            if not (isinstance(attr, (EDTController, BaseEnumController, BaseEnumController.Enum))) or key == 'RECID':
+        for key, attr in controller._field_items():
+            if key == 'RECID':
                 continue
-            
+
             if record:
                 old_val = record[0].get(key)
                 new_val = _values[0].get(key)
@@ -889,26 +999,34 @@ class UpdateManager:
         if not values:
             raise Exception("Nenhum campo foi alterado para atualizar.")
         
-        query = f"UPDATE {controller.table_name} SET " + ", ".join(set_clauses) + " WHERE RECID = ?"
-        values.append(controller._get_field_instance('RECID').value)
-        
+        # OUTPUT INSERTED.* devolve a linha já atualizada no próprio comando,
+        # dispensando o SELECT de releitura que dobrava as idas ao banco
+        query = f"UPDATE {controller.table_name} SET " + ", ".join(set_clauses) + " OUTPUT INSERTED.* WHERE RECID = ?"
+        recid_value = controller._get_field_instance('RECID').value
+        values.append(recid_value)
+
         try:
             controller.db.ttsbegin()
-            controller.db.executeCommand(query, tuple(values))
-            controller.db.ttscommit()
-            
-            recid_instance = controller._get_field_instance('RECID')
-            controller.select().where(recid_instance == recid_instance.value).limit(1).do_update(False).execute()
-
-            updated_record = controller.records[0] if controller.records else None
-            
-            if updated_record:
-                controller.set_current(updated_record)
-            
-            return True
+            rows, columns = controller.db.doQuery(query, tuple(values), ret_cols=True)
         except Exception as error:
             controller.db.ttsabort()
             raise Exception(f"Erro ao atualizar registro: {error}")
+
+        # Execução otimista: se o UPDATE não devolveu linha, o RECID não existe.
+        # Nada foi alterado, então só libera o nível de TTS desta operação:
+        # ttsabort derrubaria também o trabalho pendente de uma Transaction
+        # externa que envolva esta chamada
+        if not rows:
+            controller.db.ttscommit()
+            raise Exception(f"Registro com RECID {recid_value} não existe na tabela {controller.table_name}")
+
+        controller.db.ttscommit()
+
+        updated_record = dict(zip(columns, rows[0]))
+        controller.records = [updated_record]
+        controller.set_current(updated_record)
+
+        return True
     
     def update_recordset(controller, where: Optional[Union[FieldCondition, BinaryExpression]] = None, **fields) -> int:
         """
@@ -927,9 +1045,8 @@ class UpdateManager:
         if not fields:
             raise Exception("Nenhum campo para atualizar")
         
-        table_columns = controller.get_table_columns()
-        col_names = [col[0] for col in table_columns]
-        
+        col_names = controller._get_column_name_set()
+
         set_values = {}
         for field_key, field_val in fields.items():
             field_name = field_key.upper()
@@ -948,8 +1065,7 @@ class UpdateManager:
         
         try:
             controller.db.ttsbegin()
-            cursor = controller.db.executeCommand(query, tuple(values))
-            affected_rows = cursor.rowcount if hasattr(cursor, 'rowcount') else 0
+            affected_rows = controller.db.executeCommand(query, tuple(values)) or 0
             controller.db.ttscommit()
             return affected_rows
         except Exception as error:
@@ -1021,8 +1137,7 @@ class DeleteRecordsetManager:
         
         try:
             self._controller.db.ttsbegin()
-            cursor = self._controller.db.executeCommand(query, tuple(values))
-            affected_rows = cursor.rowcount if hasattr(cursor, 'rowcount') else 0
+            affected_rows = self._controller.db.executeCommand(query, tuple(values)) or 0
             self._controller.db.ttscommit()
             self._result_cache = affected_rows
             return affected_rows
@@ -1046,11 +1161,9 @@ class DeleteManager:
             
             if not hasattr(self, 'RECID') or self._get_field_instance('RECID').value is None:
                 raise Exception("Exclusão sem chave primaria, preencha o campo RECID")
-            
-            recid_instance = self._get_field_instance('RECID')
-            if not self._check_exists(recid_instance == recid_instance.value):
-                raise Exception(f"Registro com RECID {recid_instance.value} não existe na tabela {self.table_name}")
-            
+
+            # A existência do RECID é verificada pelo rowcount do próprio
+            # DELETE, sem SELECT prévio de ida e volta
             return func(self, *args, **kwargs)
         return wrapper
 
@@ -1062,15 +1175,25 @@ class DeleteManager:
             bool: True se excluído com sucesso
         """
         query = f"DELETE FROM {controller.table_name} WHERE RECID = ?"
-        
+        recid_value = controller._get_field_instance('RECID').value
+
         try:
             controller.db.ttsbegin()
-            controller.db.executeCommand(query, (controller._get_field_instance('RECID').value,))
-            controller.db.ttscommit()
+            affected_rows = controller.db.executeCommand(query, (recid_value,))
         except Exception as error:
             controller.db.ttsabort()
             raise Exception(f"Erro ao excluir registro: {error}")
-        
+
+        # Execução otimista: rowcount zero significa que o RECID não existia.
+        # Nada foi alterado, então só libera o nível de TTS desta operação:
+        # ttsabort derrubaria também o trabalho pendente de uma Transaction
+        # externa que envolva esta chamada
+        if affected_rows == 0:
+            controller.db.ttscommit()
+            raise Exception(f"Registro com RECID {recid_value} não existe na tabela {controller.table_name}")
+
+        controller.db.ttscommit()
+
         controller.clear()
         if hasattr(controller, 'RECID'):
             controller._get_field_instance('RECID').value = None
@@ -1120,6 +1243,34 @@ class TableController():
     
     # Cache estático de colunas com DEFAULT por tabela
     _defaults_cache: Dict[str, set] = {}
+
+    # Cache estático do schema (colunas) por tabela: instâncias novas da
+    # mesma tabela (ex.: hidratação de resultados) não repetem a consulta
+    # ao INFORMATION_SCHEMA
+    _columns_cache: Dict[str, List[List[Any]]] = {}
+
+    # Atributos de infraestrutura, congelados na classe: __getattribute__ e
+    # __setattr__ rodam em todo acesso a tabela.CAMPO, então os conjuntos não
+    # podem ser reconstruídos (e re-hasheados) por chamada
+    _PROTECTED_ATTRS = frozenset({
+        'db', 'table_name', 'records', 'Columns', 'Indexes', 'ForeignKeys',
+        '_where_conditions', '_columns', '_joins', '_order_by', '_limit',
+        '_offset', '_group_by', '_having_conditions', '_distinct', '_do_update',
+        'controller', '__class__', '__dict__', 'isUpdate', '_pending_wrapper',
+        '__select_manager', 'field', 'select', 'insert', 'update', 'delete',
+        'insert_recordset', 'update_recordset', 'delete_from', 'set_current',
+        'clear', 'validate_fields', 'validate_write', 'get_table_columns',
+        'get_columns_with_defaults', 'get_table_index', 'get_table_foreign_keys',
+        'get_table_total', 'exists', '_get_field_instance', '_is_aggregate_function',
+        '_extract_field_from_aggregate', 'SelectForUpdate'
+    })
+
+    _PROTECTED_SETATTRS = frozenset({
+        'db', 'table_name', 'records', 'Columns', 'Indexes', 'ForeignKeys',
+        '_where_conditions', '_columns', '_joins', '_order_by', '_limit',
+        '_offset', '_group_by', '_having_conditions', '_distinct', '_do_update',
+        'controller', '_pending_wrapper', '__select_manager'
+    })
     
     def __init__(self, db: Union[data, Transaction], table_name: Optional[str] = None):
         '''
@@ -1150,51 +1301,25 @@ class TableController():
         - Em contexto normal: retorna o VALOR
         - Se houver query pendente, executa antes de retornar o campo
         '''
-        protected_attrs = {
-            'db', 'table_name', 'records', 'Columns', 'Indexes', 'ForeignKeys',
-            '_where_conditions', '_columns', '_joins', '_order_by', '_limit',
-            '_offset', '_group_by', '_having_conditions', '_distinct', '_do_update',
-            'controller', '__class__', '__dict__', 'isUpdate', '_pending_wrapper',
-            '__select_manager', 'field', 'select', 'insert', 'update', 'delete',
-            'insert_recordset', 'update_recordset', 'delete_from', 'set_current',
-            'clear', 'validate_fields', 'validate_write', 'get_table_columns',
-            'get_columns_with_defaults', 'get_table_index', 'get_table_foreign_keys',
-            'get_table_total', 'exists', '_get_field_instance', '_is_aggregate_function',
-            '_extract_field_from_aggregate', 'SelectForUpdate'
-        }
-        
-        if name in protected_attrs or name.startswith('_'):
+        if name in TableController._PROTECTED_ATTRS or name.startswith('_'):
             return object.__getattribute__(self, name)
-        
+
         # Se estiver acessando um campo e houver wrapper pendente, executa
-        if not name.startswith('_'):
-            pending = object.__getattribute__(self, '_pending_wrapper')
-            if pending is not None:
-                try:
-                    pending._finalize()  # Força execução
-                    object.__setattr__(self, '_pending_wrapper', None)
-                except:
-                    pass
-        
-        attr = object.__getattribute__(self, name)
-        
-        # Retorna métodos normalmente
-        if callable(attr):
-            return attr
-        
-        # Se é EDT/Enum, SEMPRE retorna o EDT para permitir operadores
-        # O valor é acessado via .value explícito
-        if isinstance(attr, (EDTController, BaseEnumController)):
-            return attr
-        
-        return attr
+        pending = object.__getattribute__(self, '_pending_wrapper')
+        if pending is not None:
+            try:
+                pending._finalize()  # Força execução
+                object.__setattr__(self, '_pending_wrapper', None)
+            except:
+                pass
+
+        # Métodos e EDT/Enum saem como estão (o valor é acessado via .value
+        # explícito, para permitir operadores)
+        return object.__getattribute__(self, name)
   
     def __setattr__(self, name: str, value: Any):
         '''Intercepta atribuições para validar EDT/Enum'''
-        if name in ('db', 'table_name', 'records', 'Columns', 'Indexes', 'ForeignKeys',
-                    '_where_conditions', '_columns', '_joins', '_order_by', '_limit', 
-                    '_offset', '_group_by', '_having_conditions', '_distinct', '_do_update',
-                    'controller', '_pending_wrapper', '__select_manager'):
+        if name in TableController._PROTECTED_SETATTRS:
             object.__setattr__(self, name, value)
             return
 
@@ -1215,8 +1340,11 @@ class TableController():
         # Se está criando um novo EDT/Enum, armazena o nome do campo nele
         if isinstance(value, (EDTController, BaseEnumController)):
             value._field_name = name
-        
-        object.__setattr__(self, name, value)    
+
+        # Novo atributo público pode ser um campo: invalida o cache de campos
+        if not name.startswith('_'):
+            self.__dict__.pop('_field_items_cache', None)
+        object.__setattr__(self, name, value)
 
     def insert(self) -> bool:
         """Insere um novo registro na tabela"""
@@ -1232,11 +1360,9 @@ class TableController():
             raise Exception("Registro não definido para atualização.")
         
         values = [{}]
-        for key in self.__dict__:
-            attr = self._get_field_instance(key)
-            if not (isinstance(attr, (EDTController, BaseEnumController, BaseEnumController.Enum))) or key == 'RECID':
-                continue
-            values[0][key] = attr.value
+        for key, attr in self._field_items():
+            if key != 'RECID':
+                values[0][key] = attr.value
 
         ret = UpdateManager.update(self, values)
 
@@ -1333,11 +1459,17 @@ class TableController():
         '''
         if self.Columns:
             return self.Columns
-        
+
+        cached = TableController._columns_cache.get(self.table_name)
+        if cached is not None:
+            self.Columns = cached
+            return cached
+
         try:
             query = f"SELECT COLUMN_NAME, DATA_TYPE, IS_NULLABLE FROM INFORMATION_SCHEMA.COLUMNS WHERE TABLE_NAME = ?"
             rows = self.db.doQuery(query, (self.table_name,))
             self.Columns = [[row[0], row[1], row[2]] for row in rows]
+            TableController._columns_cache[self.table_name] = self.Columns
         except:
             # Fallback: usa os campos EDT/Enum da própria classe (útil para mocks)
             columns = []
@@ -1348,9 +1480,36 @@ class TableController():
                         # [nome, tipo genérico, nullable]
                         columns.append([key, 'nvarchar', 'YES'])
             self.Columns = columns
-        
+
         return self.Columns
     
+    def _field_items(self) -> tuple:
+        '''
+        Pares (nome, instância) dos campos EDT/Enum da instância, montados uma
+        vez e cacheados: os loops de insert/update/validação deixam de refazer
+        getattr + isinstance para cada atributo a cada chamada.
+        '''
+        cached = self.__dict__.get('_field_items_cache')
+        if cached is None:
+            cached = tuple(
+                (key, attr) for key, attr in self.__dict__.items()
+                if isinstance(attr, (EDTController, BaseEnumController, BaseEnumController.Enum))
+            )
+            object.__setattr__(self, '_field_items_cache', cached)
+        return cached
+
+    def _get_column_name_set(self) -> frozenset:
+        '''
+        Nomes de coluna da tabela como frozenset, cacheado na instância:
+        checagens de existência viram lookup O(1) em vez de varrer a lista
+        de colunas a cada campo consultado
+        '''
+        cached = self.__dict__.get('_column_name_set')
+        if cached is None:
+            cached = frozenset(col[0] for col in self.get_table_columns())
+            object.__setattr__(self, '_column_name_set', cached)
+        return cached
+
     def get_columns_with_defaults(self) -> set:
         '''
         Retorna conjunto de colunas que possuem DEFAULT definido no banco.
@@ -1468,16 +1627,22 @@ class TableController():
         Returns:
             Dict[str, Any]: {'valid': True/False, 'error': mensagem}
         '''
+        # Memoizado sobre o cache de campos: enquanto nenhum campo novo for
+        # vinculado à instância, o resultado da validação não muda
+        fields = self._field_items()
+        memo = self.__dict__.get('_validate_fields_memo')
+        if memo is not None and memo[0] is fields:
+            return memo[1]
+
         ret = {'valid': True, 'error': ''}
-        instance_fields = [k for k in self.__dict__ if isinstance(self._get_field_instance(k), (EDTController, BaseEnumController, BaseEnumController.Enum))]
-        table_columns = self.get_table_columns()
-        field_names = [col[0].upper() for col in table_columns]
-        invalid_fields = [f for f in instance_fields if f.upper() not in field_names]
+        field_names = {col[0].upper() for col in self.get_table_columns()}
+        invalid_fields = [k for k, _ in fields if k.upper() not in field_names]
         if invalid_fields:
             ret = {
                 'valid': False,
                 'error': f"Campo(s) inválido(s) na instância: [{', '.join(invalid_fields)}] não existem na tabela [{self.table_name}]"
             }
+        object.__setattr__(self, '_validate_fields_memo', (fields, ret))
         return ret
 
     def validate_write(self) -> Dict[str, Any]:
@@ -1497,7 +1662,7 @@ class TableController():
             if col[2] == 'NO' and col[0] != 'RECID' and col[0] not in columns_with_default
         ]
         
-        instance_fields = {k: self._get_field_instance(k) for k in self.__dict__ if isinstance(self._get_field_instance(k), (EDTController, BaseEnumController, BaseEnumController.Enum))}
+        instance_fields = dict(self._field_items())
         
         # Validar apenas campos obrigatórios que NÃO têm DEFAULT
         for field in required_fields:
@@ -1514,11 +1679,9 @@ class TableController():
         '''
         Limpa os campos da tabela (seta todos para None/valor padrão) e limpa os registros.
         '''
-        for key in self.__dict__:
-            attr = self._get_field_instance(key)
-            if isinstance(attr, (EDTController, BaseEnumController, BaseEnumController.Enum)):
-                # Seta como None, o property .value vai retornar o padrão
-                attr._value = None
+        for _key, attr in self._field_items():
+            # Seta como None, o property .value vai retornar o padrão
+            attr._value = None
         self.records = []
 
     def set_current(self, record):
@@ -1533,35 +1696,27 @@ class TableController():
             return self
         
         if isinstance(record, TableController):
-            for key in self.__dict__:
-                self_attr = self._get_field_instance(key)
-                if isinstance(self_attr, (EDTController, BaseEnumController, BaseEnumController.Enum)):
-                    if hasattr(record, key):
-                        source_attr = record._get_field_instance(key)
-                        if isinstance(source_attr, (EDTController, BaseEnumController, BaseEnumController.Enum)):
-                            self_attr.value = source_attr.value
+            for key, self_attr in self._field_items():
+                if hasattr(record, key):
+                    source_attr = record._get_field_instance(key)
+                    if isinstance(source_attr, (EDTController, BaseEnumController, BaseEnumController.Enum)):
+                        self_attr.value = source_attr.value
             return self
-        
+
         # Criar mapeamento case-insensitive
         record_upper = {k.upper(): v for k, v in record.items()}
-        
-        for key in self.__dict__:
-            # Pular atributos especiais
-            if key.startswith('_') or key in ('db', 'table_name', 'records', 'Columns', 'Indexes', 'ForeignKeys', 'isUpdate'):
-                continue
-                
-            attr = self._get_field_instance(key)
-            if isinstance(attr, (EDTController, BaseEnumController, BaseEnumController.Enum)):
-                # Busca o valor no dict com case-insensitive
-                key_upper = key.upper()
-                if key_upper in record_upper:
-                    try:
-                        attr.value = record_upper[key_upper]
-                    except (ValueError, TypeError):
-                        # Se falhar ao setar, mantém None
-                        pass
-        
-        return self    
+
+        for key, attr in self._field_items():
+            # Busca o valor no dict com case-insensitive
+            key_upper = key.upper()
+            if key_upper in record_upper:
+                try:
+                    attr.value = record_upper[key_upper]
+                except (ValueError, TypeError):
+                    # Se falhar ao setar, mantém None
+                    pass
+
+        return self
 
 class CheckParms:
     @staticmethod
@@ -9,7 +9,9 @@ class OperationManager:
     Mixin que adiciona operadores sobrecarregados para construção de queries
     Permite usar operadores Python (==, !=, <, <=, >, >=) diretamente nos campos
     '''
-    
+    __slots__ = ()
+
+
     def _get_field_condition(self):
         '''Import lazy de FieldCondition para evitar importação circular'''
         from ..TableController import FieldCondition